@@ -1,19 +1,15 @@
 """High-level API for LMStrix functionality."""
 
+import importlib
 from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any
 
 from lmstrix.api.exceptions import ModelNotFoundError
-from lmstrix.core.context_tester import ContextTester
-from lmstrix.core.inference_manager import InferenceManager
-from lmstrix.core.models import Model
-from lmstrix.loaders.model_loader import (
-    load_model_registry,
-    save_model_registry,
-    scan_and_update_registry,
-)
-from lmstrix.utils.context_parser import get_model_max_context, parse_out_ctx
 from lmstrix.utils.logging import logger
 
+if TYPE_CHECKING:
+    from lmstrix.core.models import Model
+
 try:
     from lmstrix._version import __version__
 except ImportError:
@@ -22,6 +18,30 @@ except ImportError:
     except PackageNotFoundError:
         __version__ = "0.0.0+unknown"
 
+# Heavy machinery (the LM Studio SDK, tiktoken) hides behind these modules;
+# importing it eagerly here would tax every `import lmstrix`. Method bodies
+# below import what they need on first call, and every baseline re-export
+# resolves lazily via PEP 562.
+_EXPORTS = {
+    "ContextTester": "lmstrix.core.context_tester",
+    "InferenceManager": "lmstrix.core.inference_manager",
+    "Model": "lmstrix.core.models",
+    "get_model_max_context": "lmstrix.utils.context_parser",
+    "load_model_registry": "lmstrix.loaders.model_loader",
+    "parse_out_ctx": "lmstrix.utils.context_parser",
+    "save_model_registry": "lmstrix.loaders.model_loader",
+    "scan_and_update_registry": "lmstrix.loaders.model_loader",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 class LMStrix:
     """High-level interface to LMStrix's core features.
@@ -45,7 +65,7 @@ class LMStrix:
         """
         self.verbose = verbose
 
-    def scan(self) -> list[Model]:
+    def scan(self) -> list["Model"]:
         """Scan for LM Studio models and update the registry.
 
         Discovers all models currently available in LM Studio, updates the
@@ -60,10 +80,12 @@ class LMStrix:
             >>> models = lms.scan()
             >>> logger.info(f"Found {len(models)} models")
         """
+        from lmstrix.loaders.model_loader import scan_and_update_registry
+
         registry = scan_and_update_registry(verbose=self.verbose)
         return registry.list_models()
 
-    def list_models(self) -> list[Model]:
+    def list_models(self) -> list["Model"]:
         """List all models currently in the registry.
 
         Returns the cached list of models from the local registry without
@@ -78,10 +100,12 @@ class LMStrix:
             >>> for model in models:
             ...     logger.info(f"{model.id}: {model.context_test_status}")
         """
+        from lmstrix.loaders.model_loader import load_model_registry
+
         registry = load_model_registry(verbose=self.verbose)
         return registry.list_models()
 
-    def test_model(self, model_id: str) -> Model:
+    def test_model(self, model_id: str) -> "Model":
         """Test a model's true operational context limits.
 
         Performs a binary search to find the maximum context size that the
@@ -103,6 +127,9 @@ class LMStrix:
             >>> model = lms.test_model("llama-model-id")
             >>> logger.info(f"Max context: {model.tested_max_context} tokens")
         """
+        from lmstrix.core.context_tester import ContextTester
+        from lmstrix.loaders.model_loader import load_model_registry, save_model_registry
+
         registry = load_model_registry(verbose=self.verbose)
         model = registry.get_model(model_id)
         if not model:
@@ -142,6 +169,10 @@ class LMStrix:
                 - error: str | None
                 - succeeded: bool
         """
+        from lmstrix.core.inference_manager import InferenceManager
+        from lmstrix.loaders.model_loader import load_model_registry
+        from lmstrix.utils.context_parser import get_model_max_context, parse_out_ctx
+
         registry = load_model_registry(verbose=self.verbose)
 
         # Parse out_ctx if it's a percentage
@@ -2,8 +2,6 @@
 
 import sys
 
-import fire
-
 from lmstrix.api.main import LMStrixService
 
 
@@ -56,6 +54,7 @@ class LMStrixCLI:
         file_prompt: str | None = None,
         key: str | None = None,
         dry_run: bool = False,
+        workers: int = 1,
     ) -> None:
         """Test the context limits for models.
 
@@ -73,6 +72,8 @@ class LMStrixCLI:
             file_prompt: Path to file containing the prompt to use for testing.
             key: Filter by keywords (comma-separated). Only test models matching ALL keywords.
             dry_run: Print models that would be tested without connecting to LM Studio.
+            workers: Models probed concurrently during --all threshold testing
+                (default 1; raise only for CPU-only or multi-endpoint setups).
         """
         self.service.test_models(
             model_id=model_id,
@@ -88,6 +89,7 @@ class LMStrixCLI:
             file_prompt=file_prompt,
             key=key,
             dry_run=dry_run,
+            workers=workers,
         )
 
     def infer(
@@ -235,6 +237,9 @@ def main() -> None:
         service.show_help()
         return
 
+    # Deferred so the help fast path above never pays fire's import cost.
+    import fire
+
     try:
         fire.Fire(LMStrixCLI)
     except TypeError as e:
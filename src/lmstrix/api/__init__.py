@@ -1,6 +1,8 @@
 """API client and exceptions for LMStrix."""
 
-from lmstrix.api.client import CompletionResponse, LMStudioClient
+import importlib
+from typing import Any
+
 from lmstrix.api.exceptions import (
     APIConnectionError,
     ConfigurationError,
@@ -12,6 +14,14 @@ from lmstrix.api.exceptions import (
 )
 from lmstrix.utils.logging import logger
 
+# client.py imports the LM Studio SDK (and transitively httpx/websockets),
+# which dominates package import time. Resolve its re-exports lazily (PEP
+# 562) so `from lmstrix.api.exceptions import ...` stays cheap.
+_EXPORTS = {
+    "CompletionResponse": "lmstrix.api.client",
+    "LMStudioClient": "lmstrix.api.client",
+}
+
 __all__ = [
     "APIConnectionError",
     "CompletionResponse",
@@ -23,3 +33,13 @@ __all__ = [
     "ModelLoadError",
     "ModelNotFoundError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache so subsequent lookups bypass __getattr__.
+    globals()[name] = value
+    return value
@@ -4,6 +4,7 @@ from rich.console import Console
 from rich.table import Table
 
 from lmstrix.core.describer import KEYWORD_VOCAB
+from lmstrix.core.models import ContextTestStatus
 from lmstrix.loaders.model_loader import load_model_registry
 from lmstrix.utils import setup_logging
 
@@ -17,9 +18,9 @@ def about_command(verbose: bool = False) -> None:
     models = registry.list_models()
 
     total_models = len(models)
-    tested_models = [m for m in models if m.context_test_status.value == "completed"]
-    untested_models = [m for m in models if m.context_test_status.value == "untested"]
-    failed_models = [m for m in models if m.context_test_status.value == "failed"]
+    tested_models = [m for m in models if m.context_test_status is ContextTestStatus.COMPLETED]
+    untested_models = [m for m in models if m.context_test_status is ContextTestStatus.UNTESTED]
+    failed_models = [m for m in models if m.context_test_status is ContextTestStatus.FAILED]
     vision_models = [m for m in models if m.has_vision]
     tool_models = [m for m in models if m.has_tools]
     reasoning_models = [m for m in models if getattr(m, "has_reasoning", False)]
@@ -1,37 +1,168 @@
 """LM Studio API client. Connects to your local LM Studio server to list models, load them, and run inference."""
 
+import asyncio
+import functools
 import os
+import threading
 import time
-from collections.abc import Callable, Iterator
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 
 import httpx
 import lmstudio
 from lmstudio import LMStudioServerError
-from pydantic import BaseModel, Field
 
-from lmstrix.api.exceptions import APIConnectionError, InferenceError, ModelLoadError
+from lmstrix.api.exceptions import (
+    APIConnectionError,
+    ContextLimitExceededError,
+    InferenceError,
+    ModelLoadError,
+)
+from lmstrix.utils.json_io import json_loads
 from lmstrix.utils.logging import logger
 
 DEFAULT_LMSTUDIO_BASE_URL = "http://localhost:1234"
 MODELS_ENDPOINT_TIMEOUT_SECONDS = 5.0
+# How long a cached list_loaded_models() snapshot stays valid. Short enough
+# that external load/unload actions are noticed quickly, long enough to cover
+# the common check-then-load pattern with a single SDK round-trip.
+LOADED_MODELS_CACHE_TTL_SECONDS = 2.0
+# Default cap on concurrent async completions. LM Studio serves a bounded
+# number of parallel decode slots, so unbounded fan-out only queues on the
+# server and amplifies tail latency. Override with LMSTRIX_MAX_CONCURRENCY.
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Config keys in the camelCase form the lmstudio SDK expects. Kept at module
+# scope so every completion config dict is built with the same key order,
+# letting CPython share the keys table (PEP 412) across all of them.
+_CONFIG_KEYS = (
+    "maxTokens",
+    "temperature",
+    "topKSampling",
+    "topPSampling",
+    "repeatPenalty",
+    "minPSampling",
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _config_template(
+    *,
+    max_tokens: int | None,
+    temperature: float,
+    top_k: int,
+    top_p: float,
+    repeat_penalty: float,
+    min_p: float,
+) -> MappingProxyType:
+    """Memoized read-only completion config template with a fixed key layout.
+
+    Repeated calls with identical sampling parameters (the common case in
+    benchmark sweeps) reuse one template instead of re-zipping the keys per
+    completion. The proxy keeps the cached mapping safe from mutation.
+    """
+    return MappingProxyType(
+        dict(
+            zip(
+                _CONFIG_KEYS,
+                (max_tokens, temperature, top_k, top_p, repeat_penalty, min_p),
+                strict=True,
+            ),
+        ),
+    )
 
 
-class CompletionResponse(BaseModel):
-    """The result of a text generation request. Contains the generated text and performance stats."""
-
-    content: str = Field(..., description="The text generated by the model")
-    model: str = Field(..., description="The ID of the model that generated this text")
-    usage: dict[str, int] = Field(
-        default_factory=dict, description="How many tokens were used in the prompt and response"
-    )
-    finish_reason: str | None = Field(
-        None, description="Why the model stopped generating (e.g., hit a stop word or length limit)"
-    )
-    ttft_seconds: float | None = Field(
-        None, description="Seconds elapsed before the model output the first token (TTFT)"
+def _build_config(
+    *,
+    max_tokens: int | None,
+    temperature: float,
+    top_k: int,
+    top_p: float,
+    repeat_penalty: float,
+    min_p: float,
+) -> dict[str, Any]:
+    """Build the SDK completion config dict from the memoized template.
+
+    The lmstudio SDK validates the config with ``isinstance(config, dict)``,
+    so this must hand over a real dict, not the cached MappingProxyType.
+    Copying the template is a flat memcpy that preserves the shared key order
+    without exposing a shared mutable object to the SDK.
+    """
+    return dict(
+        _config_template(
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_k=top_k,
+            top_p=top_p,
+            repeat_penalty=repeat_penalty,
+            min_p=min_p,
+        ),
     )
-    tps: float | None = Field(None, description="Generation speed in tokens per second (TPS)")
+
+
+@dataclass(slots=True)
+class CompletionResponse:
+    """The result of a text generation request. Contains the generated text and performance stats.
+
+    A plain slots dataclass rather than a Pydantic model: instances are built
+    internally from already-validated SDK responses, so the validator pipeline
+    would only add per-call construction cost.
+
+    Attributes:
+        content: The text generated by the model.
+        model: The ID of the model that generated this text.
+        usage: How many tokens were used in the prompt and response.
+        finish_reason: Why the model stopped generating (e.g., stop word or length limit).
+        ttft_seconds: Seconds elapsed before the model output the first token (TTFT).
+        tps: Generation speed in tokens per second (TPS).
+    """
+
+    content: str
+    model: str
+    usage: dict[str, int] = field(default_factory=dict)
+    finish_reason: str | None = None
+    ttft_seconds: float | None = None
+    tps: float | None = None
+
+
+@functools.lru_cache(maxsize=1)
+def _token_encoder() -> Any:
+    """Return the shared cl100k_base encoder, or None if unavailable.
+
+    cl100k_base is the project's universal tokeniser proxy (±5-15% vs
+    model-specific tokenisers — see core/prompts.py). Cached so the encoding
+    tables load once; None when tiktoken can't fetch them (e.g. offline), in
+    which case the client-side overflow check is simply skipped.
+    """
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+# cl100k_base can overestimate model-specific tokenisers by up to ~15%
+# (see core/prompts.py), so the client-side rejection only fires when the
+# count exceeds the limit by more than that error bound; borderline prompts
+# are left for the server, which counts with the real tokeniser.
+_OVERFLOW_MARGIN = 1.15
+
+
+def _check_context_overflow(model_id: str, prompt: str, context_limit: int) -> None:
+    """Raise ContextLimitExceededError when the prompt can't fit client-side.
+
+    Counting tokens locally short-circuits the whole load-and-infer round
+    trip for prompts the server would certainly reject anyway.
+    """
+    encoder = _token_encoder()
+    if encoder is None:
+        return
+    input_tokens = len(encoder.encode(prompt))
+    if input_tokens > context_limit * _OVERFLOW_MARGIN:
+        raise ContextLimitExceededError(model_id, input_tokens, context_limit)
 
 
 def _get_attr(obj: Any, *names: str, default: Any = None) -> Any:
@@ -119,28 +250,87 @@ def _sdk_model_info_by_key(models: Any) -> dict[str, dict[str, Any]]:
 class LMStudioClient:
     """Talks to your local LM Studio server. Manages models and runs inference."""
 
-    def __init__(self, verbose: bool = False) -> None:
-        """Initialize the LM Studio client."""
+    def __init__(self, verbose: bool = False, max_concurrency: int | None = None) -> None:
+        """Initialize the LM Studio client.
+
+        Args:
+            verbose: Enable verbose logging output.
+            max_concurrency: Cap on concurrent async completions. Defaults to
+                the LMSTRIX_MAX_CONCURRENCY env var, then DEFAULT_MAX_CONCURRENCY.
+        """
         if verbose:
             logger.enable("lmstrix")
         else:
             logger.disable("lmstrix")
+        # Cached (timestamp, models) snapshot of loaded models, so the common
+        # is_model_loaded() → load_model() sequence needs only one SDK query.
+        self._loaded_cache: tuple[float, list[dict[str, Any]]] | None = None
+        if max_concurrency is None:
+            try:
+                max_concurrency = int(
+                    os.environ.get("LMSTRIX_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY),
+                )
+            except ValueError:
+                max_concurrency = DEFAULT_MAX_CONCURRENCY
+        self.max_concurrency = max(1, max_concurrency)
+        # Created lazily in acompletion() so the semaphore binds to the loop
+        # that actually runs the completions, not whatever (if any) loop is
+        # current at construction time. The loop is remembered so a client
+        # reused across separate asyncio.run() calls gets a fresh semaphore
+        # instead of one bound to a closed loop.
+        self._completion_sem: asyncio.Semaphore | None = None
+        self._completion_sem_loop: asyncio.AbstractEventLoop | None = None
+        # Persistent keep-alive HTTP client for the local REST API, created on
+        # first use so clients that never touch REST pay nothing.
+        self._http: httpx.Client | None = None
+        # model_id → SDK model_key resolved by a successful load, so repeat
+        # loads of the same model skip the downloaded-models scan entirely.
+        self._model_key_cache: dict[str, str] = {}
+
+    def _http_client(self) -> httpx.Client:
+        """Return the persistent REST client, creating it on first use.
+
+        Reusing one keep-alive connection pool avoids paying TCP setup and
+        header parsing per request — on a localhost endpoint that setup is
+        the dominant non-LLM latency.
+        """
+        if self._http is None:
+            base_url = os.environ.get("LMSTUDIO_BASE_URL", DEFAULT_LMSTUDIO_BASE_URL).rstrip("/")
+            headers = {}
+            if token := os.environ.get("LM_API_TOKEN"):
+                headers["Authorization"] = f"Bearer {token}"
+            self._http = httpx.Client(
+                base_url=base_url,
+                headers=headers,
+                timeout=MODELS_ENDPOINT_TIMEOUT_SECONDS,
+                limits=httpx.Limits(max_keepalive_connections=8),
+            )
+        return self._http
+
+    def close(self) -> None:
+        """Release the persistent HTTP connection pool, if one was created."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    def __enter__(self) -> "LMStudioClient":
+        """Support use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the HTTP pool on context exit."""
+        self.close()
+
+    def _invalidate_loaded_cache(self) -> None:
+        """Drop the cached loaded-models snapshot after a load/unload."""
+        self._loaded_cache = None
 
     def _list_rest_model_capabilities(self) -> dict[str, dict[str, Any]]:
         """Fetch current model capabilities from LM Studio's OpenAI-compatible REST API."""
-        base_url = os.environ.get("LMSTUDIO_BASE_URL", DEFAULT_LMSTUDIO_BASE_URL).rstrip("/")
-        headers = {}
-        if token := os.environ.get("LM_API_TOKEN"):
-            headers["Authorization"] = f"Bearer {token}"
-
         try:
-            response = httpx.get(
-                f"{base_url}/api/v1/models",
-                headers=headers,
-                timeout=MODELS_ENDPOINT_TIMEOUT_SECONDS,
-            )
+            response = self._http_client().get("/api/v1/models")
             response.raise_for_status()
-            payload = response.json()
+            payload = json_loads(response.content)
         except Exception as e:
             logger.debug(f"Could not read REST model capabilities: {e}")
             return {}
@@ -200,6 +390,7 @@ class LMStudioClient:
 
     def load_model(self, model_path: str, context_len: int, unload_all: bool = True) -> Any:
         """Load a model with a specific context length using model path."""
+        self._invalidate_loaded_cache()
         try:
             if unload_all:
                 self.unload_all_models()
@@ -225,33 +416,39 @@ class LMStudioClient:
 
     def load_model_by_id(self, model_id: str, context_len: int) -> Any:
         """Load a model with a specific context length using model ID."""
+        self._invalidate_loaded_cache()
         try:
-            # First, try to find the model in LM Studio's list to get the correct model_key
-            downloaded_models = lmstudio.list_downloaded_models()
-            model_key = None
-
-            for model in downloaded_models:
-                info = model.info
-                # Try multiple matching strategies
-                lms_model_key = getattr(info, "model_key", getattr(info, "modelKey", ""))
-                display_name = getattr(info, "display_name", getattr(info, "displayName", ""))
-
-                # Match by model_key, display_name, or if model_id appears in path
-                if model_id in (lms_model_key, display_name) or model_id in str(
-                    getattr(info, "path", ""),
-                ):
-                    model_key = lms_model_key
-                    logger.debug(f"Found model match: {model_id} -> {model_key}")
-                    break
-
-            if not model_key:
-                # Fallback: try the model_id directly
-                model_key = model_id
-                logger.warning(f"No exact match found for {model_id}, trying directly")
+            model_key = self._model_key_cache.get(model_id)
+            if model_key is None:
+                # First, try to find the model in LM Studio's list to get the correct model_key
+                downloaded_models = lmstudio.list_downloaded_models()
+
+                for model in downloaded_models:
+                    info = model.info
+                    # Try multiple matching strategies
+                    lms_model_key = getattr(info, "model_key", getattr(info, "modelKey", ""))
+                    display_name = getattr(info, "display_name", getattr(info, "displayName", ""))
+
+                    # Match by model_key, display_name, or if model_id appears in path
+                    if model_id in (lms_model_key, display_name) or model_id in str(
+                        getattr(info, "path", ""),
+                    ):
+                        model_key = lms_model_key
+                        logger.debug(f"Found model match: {model_id} -> {model_key}")
+                        break
+
+                if not model_key:
+                    # Fallback: try the model_id directly
+                    model_key = model_id
+                    logger.warning(f"No exact match found for {model_id}, trying directly")
 
             # Use camelCase for config keys as expected by lmstudio SDK
             config: Any = {"contextLength": int(context_len)}
-            return lmstudio.llm(model_key, config=config)
+            llm = lmstudio.llm(model_key, config=config)
+            # Cache only after a successful load so a transient mismatch
+            # doesn't pin repeat loads to a bad key.
+            self._model_key_cache[model_id] = model_key
+            return llm
         except Exception as e:
             # Get available models for better error message
             try:
@@ -272,6 +469,11 @@ class LMStudioClient:
         Returns:
             List of dicts with model information including id and context_length
         """
+        if self._loaded_cache is not None:
+            cached_at, cached_models = self._loaded_cache
+            if time.time() - cached_at < LOADED_MODELS_CACHE_TTL_SECONDS:
+                return cached_models
+
         try:
             loaded = lmstudio.list_loaded_models()
             models_info = []
@@ -290,6 +492,7 @@ class LMStudioClient:
                     models_info.append(model_info)
                 except (AttributeError, TypeError) as e:
                     logger.warning(f"Failed to extract info from loaded model: {e}")
+            self._loaded_cache = (time.time(), models_info)
             return models_info
         except (ImportError, RuntimeError) as e:
             logger.warning(f"Failed to list loaded models: {e}")
@@ -304,15 +507,21 @@ class LMStudioClient:
         Returns:
             Tuple of (is_loaded, context_length)
         """
-        loaded_models = self.get_loaded_models()
-        for model in loaded_models:
-            # Check various possible matches
-            if model_id in (model.get("id"), model.get("model_key")):
-                return True, model.get("context_length")
+        # Index the (cached) snapshot by both id and model_key for O(1) lookup.
+        loaded_by_key: dict[str, dict[str, Any]] = {}
+        for model in self.get_loaded_models():
+            for key in (model.get("id"), model.get("model_key")):
+                if isinstance(key, str):
+                    loaded_by_key.setdefault(key, model)
+
+        match = loaded_by_key.get(model_id)
+        if match is not None:
+            return True, match.get("context_length")
         return False, None
 
     def unload_all_models(self) -> None:
         """Unload all currently loaded models to free up resources."""
+        self._invalidate_loaded_cache()
         try:
             [llm.unload() for llm in lmstudio.list_loaded_models()]
             logger.info("All models unloaded successfully")
@@ -336,43 +545,51 @@ class LMStudioClient:
         **kwargs: Any,  # Accept additional parameters
     ) -> CompletionResponse:
         """Make a completion request to a loaded LM Studio model."""
+        # Bind the logger once so the ~15 log calls below reuse the same
+        # options object instead of re-resolving handlers on every call.
+        _log = logger.opt(lazy=True)
+
         # Fall back to the loaded model's own id when no explicit id was passed,
         # so error messages and logs identify the model under test.
         if model_id is None:
             model_id = getattr(llm, "model_id", None)
 
+        # Reject prompts that can't fit before paying the server round-trip.
+        if model_context_length is not None and model_context_length > 0:
+            _check_context_overflow(model_id or "unknown", prompt, model_context_length)
+
         # LM Studio's complete() method accepts a config dict
         # Pass maxTokens (camelCase) to prevent models from generating indefinitely
 
         # Handle maxTokens - use -1 for unlimited like LM Studio GUI
         max_tokens = out_ctx if out_ctx > 0 else -1
 
-        # Build config with all parameters matching LM Studio
-        config = {
-            "maxTokens": max_tokens if max_tokens != -1 else None,  # None for unlimited
-            "temperature": temperature,
-            "topKSampling": top_k,
-            "topPSampling": top_p,
-            "repeatPenalty": repeat_penalty,
-            "minPSampling": min_p,
-        }
+        # Build config with all parameters matching LM Studio (None for unlimited)
+        config = _build_config(
+            max_tokens=max_tokens if max_tokens != -1 else None,
+            temperature=temperature,
+            top_k=top_k,
+            top_p=top_p,
+            repeat_penalty=repeat_penalty,
+            min_p=min_p,
+        )
 
         # Log comparison with LM Studio defaults
-        logger.debug("═" * 60)
-        logger.debug("🔍 DIAGNOSTIC: Inference Parameters Comparison")
-        logger.debug(f"   Temperature: {temperature} (LM Studio GUI: 0.8)")
-        logger.debug(f"   Top K: {top_k} (LM Studio GUI: 20)")
-        logger.debug(f"   Top P: {top_p} (LM Studio GUI: 0.95)")
-        logger.debug(f"   Min P: {min_p} (LM Studio GUI: 0.05)")
-        logger.debug(f"   Repeat Penalty: {repeat_penalty} (LM Studio GUI: 1.1)")
-        logger.debug(f"   Max Tokens: {max_tokens} (LM Studio GUI: -1/unlimited)")
-        logger.debug(f"   Context Length: {model_context_length} (LM Studio GUI: 131072)")
-        logger.debug("═" * 60)
+        _log.debug("═" * 60)
+        _log.debug("🔍 DIAGNOSTIC: Inference Parameters Comparison")
+        _log.debug(f"   Temperature: {temperature} (LM Studio GUI: 0.8)")
+        _log.debug(f"   Top K: {top_k} (LM Studio GUI: 20)")
+        _log.debug(f"   Top P: {top_p} (LM Studio GUI: 0.95)")
+        _log.debug(f"   Min P: {min_p} (LM Studio GUI: 0.05)")
+        _log.debug(f"   Repeat Penalty: {repeat_penalty} (LM Studio GUI: 1.1)")
+        _log.debug(f"   Max Tokens: {max_tokens} (LM Studio GUI: -1/unlimited)")
+        _log.debug(f"   Context Length: {model_context_length} (LM Studio GUI: 131072)")
+        _log.debug("═" * 60)
 
         # Enhanced logging with beautiful formatting
-        logger.info("═" * 60)
-        logger.info(f"🤖 MODEL: {model_id or 'unknown'}")
-        logger.info(
+        _log.info("═" * 60)
+        _log.info(f"🤖 MODEL: {model_id or 'unknown'}")
+        _log.info(
             f"🔧 CONFIG: maxTokens={config['maxTokens']}, temperature={config['temperature']}, "
             f"topK={config['topKSampling']}, topP={config['topPSampling']}, "
             f"minP={config['minPSampling']}, repeatPenalty={config['repeatPenalty']}",
@@ -384,22 +601,22 @@ class LMStudioClient:
                 # Handle mock objects in tests that don't support formatting
                 context_length = llm.config.contextLength
                 if isinstance(context_length, int):
-                    logger.info(f"📏 CONTEXT: {context_length:,} tokens")
+                    _log.info(f"📏 CONTEXT: {context_length:,} tokens")
                 else:
-                    logger.info(f"📏 CONTEXT: {context_length} tokens")
+                    _log.info(f"📏 CONTEXT: {context_length} tokens")
             except (TypeError, ValueError):
                 # In case of mock objects or other issues
-                logger.info(f"📏 CONTEXT: {llm.config.contextLength} tokens")
+                _log.info(f"📏 CONTEXT: {llm.config.contextLength} tokens")
 
         # Log full prompt in verbose mode using stderr to avoid loguru parsing issues
         prompt_lines = prompt.count("\n") + 1
         prompt_chars = len(prompt)
-        logger.info(f"📝 Prompt ({prompt_lines} lines, {prompt_chars} chars):")
+        _log.info(f"📝 Prompt ({prompt_lines} lines, {prompt_chars} chars):")
         # Only print prompt if logger is enabled for debug mode
         if logger._core.handlers:
-            logger.debug(f"Prompt content: {prompt}")
+            _log.debug(f"Prompt content: {prompt}")
 
-        logger.info("═" * 60)
+        _log.info("═" * 60)
 
         start_time = time.time()
         captured_ttft: float | None = None
@@ -408,10 +625,10 @@ class LMStudioClient:
         try:
             # Direct synchronous call - no threading or async
             # Don't log config dict to avoid format string errors
-            logger.debug("Calling llm.complete with provided config")
+            _log.debug("Calling llm.complete with provided config")
             response = llm.complete(prompt, config=config)
             # Don't log raw response to avoid tag parsing errors
-            logger.debug("Received response from model")
+            _log.debug("Received response from model")
 
             # Calculate total inference time
             total_inference_time = time.time() - start_time
@@ -419,37 +636,37 @@ class LMStudioClient:
             # Extract and log performance stats in verbose mode
             if hasattr(response, "stats") and response.stats:
                 stats = response.stats
-                logger.info("═" * 60)
-                logger.info("📊 INFERENCE STATS")
+                _log.info("═" * 60)
+                _log.info("📊 INFERENCE STATS")
 
                 # Time to first token
                 if hasattr(stats, "time_to_first_token_sec"):
                     captured_ttft = stats.time_to_first_token_sec
-                    logger.info(f"⚡ Time to first token: {captured_ttft:.2f}s")
+                    _log.info(f"⚡ Time to first token: {captured_ttft:.2f}s")
 
                 # Total inference time
-                logger.info(f"⏱️  Total inference time: {total_inference_time:.2f}s")
+                _log.info(f"⏱️  Total inference time: {total_inference_time:.2f}s")
 
                 # Token counts
                 if hasattr(stats, "predicted_tokens_count"):
-                    logger.info(f"🔢 Predicted tokens: {stats.predicted_tokens_count:,}")
+                    _log.info(f"🔢 Predicted tokens: {stats.predicted_tokens_count:,}")
 
                 if hasattr(stats, "prompt_tokens_count"):
-                    logger.info(f"📝 Prompt tokens: {stats.prompt_tokens_count:,}")
+                    _log.info(f"📝 Prompt tokens: {stats.prompt_tokens_count:,}")
 
                 if hasattr(stats, "total_tokens_count"):
-                    logger.info(f"🎯 Total tokens: {stats.total_tokens_count:,}")
+                    _log.info(f"🎯 Total tokens: {stats.total_tokens_count:,}")
 
                 # Tokens per second
                 if hasattr(stats, "tokens_per_second"):
                     captured_tps = stats.tokens_per_second
-                    logger.info(f"🚀 Tokens/second: {captured_tps:.2f}")
+                    _log.info(f"🚀 Tokens/second: {captured_tps:.2f}")
 
                 # Stop reason
                 if hasattr(stats, "stop_reason"):
-                    logger.info(f"🛑 Stop reason: {stats.stop_reason}")
+                    _log.info(f"🛑 Stop reason: {stats.stop_reason}")
 
-                logger.info("═" * 60)
+                _log.info("═" * 60)
         except LMStudioServerError as e:
             # Handle specific LM Studio server errors
             error_message = str(e).lower()
@@ -457,19 +674,19 @@ class LMStudioClient:
                 "llama_memory is null" in error_message
                 or "unable to reuse from cache" in error_message
             ):
-                logger.warning(f"Model {model_id} has memory/cache issues: {e}")
+                _log.warning(f"Model {model_id} has memory/cache issues: {e}")
                 raise InferenceError(
                     model_id or "unknown",
                     f"Model memory/cache error - model may need to be reloaded: {e}",
                 ) from e
             if "model not found" in error_message or "no model loaded" in error_message:
-                logger.warning(f"Model {model_id} not found or unloaded: {e}")
+                _log.warning(f"Model {model_id} not found or unloaded: {e}")
                 raise ModelLoadError(
                     model_id or "unknown",
                     f"Model not available in LM Studio: {e}",
                 ) from e
             # Generic LM Studio server error
-            logger.error(f"LM Studio server error for {model_id}: {e}")
+            _log.error(f"LM Studio server error for {model_id}: {e}")
             raise InferenceError(model_id or "unknown", f"LM Studio server error: {e}") from e
         except (TypeError, AttributeError, ValueError) as e:
             # Check for specific error patterns that indicate model issues
@@ -484,23 +701,29 @@ class LMStudioClient:
             # Any other failure during generation is surfaced as an inference error.
             raise InferenceError(model_id or "unknown", f"Inference failed: {e}") from e
 
-        # Parse the response - could be PredictionResult, dict, or string
-        if hasattr(response, "content"):
-            content = response.content
-        elif hasattr(response, "text"):
-            content = response.text
-        elif isinstance(response, dict):
-            # Handle dict response format (common in tests)
-            if response.get("choices"):
-                content = response["choices"][0].get("text", "")
+        # Parse the response - could be PredictionResult, dict, or string.
+        # Probe .content/.text with getattr sentinels so the common SDK path
+        # is a single attribute lookup and str() never materializes a large
+        # PredictionResult repr unless the object is genuinely unknown. The
+        # sentinel (not None) keeps an explicit content=None flowing into the
+        # empty-response check below instead of being repr'd.
+        missing = object()
+        content = getattr(response, "content", missing)
+        if content is missing:
+            content = getattr(response, "text", missing)
+        if content is missing:
+            if isinstance(response, dict):
+                # Handle dict response format (common in tests)
+                if response.get("choices"):
+                    content = response["choices"][0].get("text", "")
+                else:
+                    content = str(response)
             else:
                 content = str(response)
-        else:
-            content = str(response)
 
         # Check for empty responses which might indicate a problem
         if not content or not content.strip():
-            logger.warning(f"Model {model_id} returned empty response")
+            _log.warning(f"Model {model_id} returned empty response")
             raise InferenceError(
                 model_id or "unknown",
                 "Model returned empty response - may be unresponsive",
@@ -525,6 +748,169 @@ class LMStudioClient:
             tps=captured_tps,
         )
 
+    async def acompletion(
+        self,
+        llm: Any,  # The loaded model object from lmstudio.llm
+        prompt: str,
+        **kwargs: Any,  # Forwarded to completion()
+    ) -> CompletionResponse:
+        """Run a completion without blocking the event loop.
+
+        The lmstudio SDK's ``complete()`` is synchronous, so awaiting it
+        directly would stall the loop for the whole generation. Offloading to
+        a worker thread via ``asyncio.to_thread`` lets concurrent callers
+        overlap their SDK I/O.
+
+        Args:
+            llm: The loaded model object from lmstudio.llm.
+            prompt: The prompt to complete.
+            **kwargs: Additional parameters forwarded to completion().
+
+        Returns:
+            The CompletionResponse produced by completion().
+        """
+        loop = asyncio.get_running_loop()
+        if self._completion_sem is None or self._completion_sem_loop is not loop:
+            # A Semaphore binds to the loop that first awaits it, so a client
+            # reused across separate asyncio.run() calls needs a fresh one or
+            # the second run raises "bound to a different event loop".
+            self._completion_sem = asyncio.Semaphore(self.max_concurrency)
+            self._completion_sem_loop = loop
+        async with self._completion_sem:
+            return await asyncio.to_thread(self.completion, llm, prompt, **kwargs)
+
+    async def batch_acompletion(
+        self,
+        llm: Any,  # The loaded model object from lmstudio.llm
+        prompts: list[str],
+        return_exceptions: bool = True,
+        **kwargs: Any,  # Forwarded to each completion()
+    ) -> list[CompletionResponse | BaseException]:
+        """Run several completions concurrently against a loaded model.
+
+        Fans one acompletion() coroutine out per prompt and gathers them, so
+        SDK round-trips overlap instead of serializing. With
+        ``return_exceptions=True`` (the default) a failed prompt yields its
+        exception in the result list rather than cancelling the whole batch.
+
+        Args:
+            llm: The loaded model object from lmstudio.llm.
+            prompts: Prompts to complete, one task each.
+            return_exceptions: Return per-prompt exceptions instead of raising.
+            **kwargs: Additional parameters forwarded to each completion().
+
+        Returns:
+            Results in prompt order: CompletionResponse per success, or the
+            raised exception when return_exceptions is enabled.
+        """
+        tasks = [self.acompletion(llm, prompt, **kwargs) for prompt in prompts]
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+
+    def batch_completion_single_request(
+        self,
+        model_id: str,
+        prompts: list[str],
+        max_tokens: int = 2048,
+        temperature: float = 0.8,
+    ) -> list[str]:
+        """Complete several prompts with one /v1/completions request.
+
+        LM Studio's OpenAI-compatible legacy completions endpoint accepts a
+        list of prompt strings and decodes them as a single server-side
+        batch, amortizing RPC overhead that per-prompt requests would pay N
+        times. Results are demultiplexed back into prompt order via each
+        choice's index.
+
+        Args:
+            model_id: Model identifier as known to the server.
+            prompts: Prompts to complete in one batch.
+            max_tokens: Per-prompt generation cap.
+            temperature: Sampling temperature.
+
+        Returns:
+            Generated texts, one per prompt, in prompt order.
+
+        Raises:
+            InferenceError: If the request fails or the response is malformed.
+        """
+        try:
+            response = self._http_client().post(
+                "/v1/completions",
+                json={
+                    "model": model_id,
+                    "prompt": prompts,
+                    "max_tokens": max_tokens,
+                    "temperature": temperature,
+                },
+                timeout=None,
+            )
+            response.raise_for_status()
+            payload = json_loads(response.content)
+        except Exception as e:
+            raise InferenceError(model_id, f"Batch completion request failed: {e}") from e
+
+        results: list[str] = [""] * len(prompts)
+        try:
+            for choice in payload["choices"]:
+                results[choice["index"]] = choice.get("text", "")
+        except (KeyError, IndexError, TypeError) as e:
+            raise InferenceError(model_id, f"Malformed batch completion response: {e}") from e
+        return results
+
+    async def astream_completion(
+        self,
+        llm: Any,  # The loaded model object from lmstudio.llm
+        prompt: str,
+        **kwargs: Any,  # Forwarded to stream_completion()
+    ) -> AsyncIterator[str]:
+        """Stream completion fragments without blocking the event loop.
+
+        Runs the synchronous stream_completion() generator in a worker thread
+        and hands fragments back through an asyncio queue, so async callers
+        see tokens as they arrive (low first-token latency) while the loop
+        stays free to interleave other work.
+
+        Args:
+            llm: The loaded model object from lmstudio.llm.
+            prompt: The prompt to complete.
+            **kwargs: Additional parameters forwarded to stream_completion().
+
+        Yields:
+            Fragments in generation order.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[Any] = asyncio.Queue()
+        done = object()  # Sentinel marking normal end-of-stream.
+        # Set when the consumer goes away (break / aclose), so the pump stops
+        # at the next fragment instead of draining the rest of the generation
+        # into the queue.
+        stop = threading.Event()
+
+        def pump() -> None:
+            """Drain the sync stream into the queue from a worker thread."""
+            try:
+                for fragment in self.stream_completion(llm, prompt, **kwargs):
+                    if stop.is_set():
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, fragment)
+            except BaseException as e:  # re-raised on the async side
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            else:
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+
+        pump_task = loop.run_in_executor(None, pump)
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            await pump_task
+
     def stream_completion(
         self,
         llm: Any,  # The loaded model object from lmstudio.llm
@@ -544,35 +930,40 @@ class LMStudioClient:
         **kwargs: Any,  # Accept additional parameters
     ) -> Iterator[str]:
         """Stream a completion request to a loaded LM Studio model."""
+        # Bind the logger once so the log calls below reuse the same options
+        # object instead of re-resolving handlers on every call.
+        _log = logger.opt(lazy=True)
+
         # Handle maxTokens - use -1 for unlimited like LM Studio GUI
+
         max_tokens = out_ctx if out_ctx > 0 else -1
 
-        # Build config with all parameters matching LM Studio
-        config = {
-            "maxTokens": max_tokens if max_tokens != -1 else None,  # None for unlimited
-            "temperature": temperature,
-            "topKSampling": top_k,
-            "topPSampling": top_p,
-            "repeatPenalty": repeat_penalty,
-            "minPSampling": min_p,
-        }
+        # Build config with all parameters matching LM Studio (None for unlimited)
+        config = _build_config(
+            max_tokens=max_tokens if max_tokens != -1 else None,
+            temperature=temperature,
+            top_k=top_k,
+            top_p=top_p,
+            repeat_penalty=repeat_penalty,
+            min_p=min_p,
+        )
 
         # Log comparison with LM Studio defaults
-        logger.debug("═" * 60)
-        logger.debug("🔍 DIAGNOSTIC: Streaming Inference Parameters")
-        logger.debug(f"   Temperature: {temperature} (LM Studio GUI: 0.8)")
-        logger.debug(f"   Top K: {top_k} (LM Studio GUI: 20)")
-        logger.debug(f"   Top P: {top_p} (LM Studio GUI: 0.95)")
-        logger.debug(f"   Min P: {min_p} (LM Studio GUI: 0.05)")
-        logger.debug(f"   Repeat Penalty: {repeat_penalty} (LM Studio GUI: 1.1)")
-        logger.debug(f"   Max Tokens: {max_tokens} (LM Studio GUI: -1/unlimited)")
-        logger.debug(f"   Stream Timeout: {stream_timeout}s")
-        logger.debug("═" * 60)
+        _log.debug("═" * 60)
+        _log.debug("🔍 DIAGNOSTIC: Streaming Inference Parameters")
+        _log.debug(f"   Temperature: {temperature} (LM Studio GUI: 0.8)")
+        _log.debug(f"   Top K: {top_k} (LM Studio GUI: 20)")
+        _log.debug(f"   Top P: {top_p} (LM Studio GUI: 0.95)")
+        _log.debug(f"   Min P: {min_p} (LM Studio GUI: 0.05)")
+        _log.debug(f"   Repeat Penalty: {repeat_penalty} (LM Studio GUI: 1.1)")
+        _log.debug(f"   Max Tokens: {max_tokens} (LM Studio GUI: -1/unlimited)")
+        _log.debug(f"   Stream Timeout: {stream_timeout}s")
+        _log.debug("═" * 60)
 
         # Enhanced logging with beautiful formatting
-        logger.info("═" * 60)
-        logger.info(f"🤖 MODEL: {model_id or 'unknown'} (streaming)")
-        logger.info(
+        _log.info("═" * 60)
+        _log.info(f"🤖 MODEL: {model_id or 'unknown'} (streaming)")
+        _log.info(
             f"🔧 CONFIG: maxTokens={config['maxTokens']}, temperature={config['temperature']}, "
             f"topK={config['topKSampling']}, topP={config['topPSampling']}, "
             f"minP={config['minPSampling']}, repeatPenalty={config['repeatPenalty']}",
@@ -583,21 +974,21 @@ class LMStudioClient:
             try:
                 context_length = llm.config.contextLength
                 if isinstance(context_length, int):
-                    logger.info(f"📏 CONTEXT: {context_length:,} tokens")
+                    _log.info(f"📏 CONTEXT: {context_length:,} tokens")
                 else:
-                    logger.info(f"📏 CONTEXT: {context_length} tokens")
+                    _log.info(f"📏 CONTEXT: {context_length} tokens")
             except (TypeError, ValueError):
-                logger.info(f"📏 CONTEXT: {llm.config.contextLength} tokens")
+                _log.info(f"📏 CONTEXT: {llm.config.contextLength} tokens")
 
         # Log full prompt in verbose mode using stderr to avoid loguru parsing issues
         prompt_lines = prompt.count("\n") + 1
         prompt_chars = len(prompt)
-        logger.info(f"📝 Prompt ({prompt_lines} lines, {prompt_chars} chars):")
+        _log.info(f"📝 Prompt ({prompt_lines} lines, {prompt_chars} chars):")
         # Only print prompt if logger is enabled for debug mode
         if logger._core.handlers:
-            logger.debug(f"Prompt content: {prompt}")
+            _log.debug(f"Prompt content: {prompt}")
 
-        logger.info("═" * 60)
+        _log.info("═" * 60)
 
         start_time = time.time()
         last_token_time = start_time
@@ -617,11 +1008,11 @@ class LMStudioClient:
 
         def handle_first_token(elapsed_seconds: float) -> None:
             """Handle first token event."""
-            logger.info(f"⚡ First token received after {elapsed_seconds:.2f}s")
+            _log.info(f"⚡ First token received after {elapsed_seconds:.2f}s")
 
         try:
             # Create streaming completion with callbacks
-            logger.debug("Starting streaming completion")
+            _log.debug("Starting streaming completion")
             stream = llm.complete_stream(
                 prompt,
                 config=config,
@@ -633,7 +1024,7 @@ class LMStudioClient:
             for fragment in stream:
                 # Check for timeout
                 if time.time() - last_token_time > stream_timeout:
-                    logger.warning(f"Stream timeout - no tokens for {stream_timeout}s")
+                    _log.warning(f"Stream timeout - no tokens for {stream_timeout}s")
                     raise InferenceError(
                         model_id or "unknown",
                         f"Stream timeout - no tokens received for {stream_timeout} seconds",
@@ -646,12 +1037,12 @@ class LMStudioClient:
             total_time = time.time() - start_time
             tokens_per_second = token_count / total_time if total_time > 0 else 0
 
-            logger.info("═" * 60)
-            logger.info("📊 STREAMING INFERENCE STATS")
-            logger.info(f"⏱️  Total inference time: {total_time:.2f}s")
-            logger.info(f"🔢 Total tokens: {token_count:,}")
-            logger.info(f"🚀 Tokens/second: {tokens_per_second:.2f}")
-            logger.info("═" * 60)
+            _log.info("═" * 60)
+            _log.info("📊 STREAMING INFERENCE STATS")
+            _log.info(f"⏱️  Total inference time: {total_time:.2f}s")
+            _log.info(f"🔢 Total tokens: {token_count:,}")
+            _log.info(f"🚀 Tokens/second: {tokens_per_second:.2f}")
+            _log.info("═" * 60)
 
         except LMStudioServerError as e:
             # Handle specific LM Studio server errors
@@ -660,19 +1051,19 @@ class LMStudioClient:
                 "llama_memory is null" in error_message
                 or "unable to reuse from cache" in error_message
             ):
-                logger.warning(f"Model {model_id} has memory/cache issues: {e}")
+                _log.warning(f"Model {model_id} has memory/cache issues: {e}")
                 raise InferenceError(
                     model_id or "unknown",
                     f"Model memory/cache error - model may need to be reloaded: {e}",
                 ) from e
             if "model not found" in error_message or "no model loaded" in error_message:
-                logger.warning(f"Model {model_id} not found or unloaded: {e}")
+                _log.warning(f"Model {model_id} not found or unloaded: {e}")
                 raise ModelLoadError(
                     model_id or "unknown",
                     f"Model not available in LM Studio: {e}",
                 ) from e
             # Generic LM Studio server error
-            logger.error(f"LM Studio server error for {model_id}: {e}")
+            _log.error(f"LM Studio server error for {model_id}: {e}")
             raise InferenceError(model_id or "unknown", f"LM Studio server error: {e}") from e
         except (TypeError, AttributeError, ValueError) as e:
             # Check for specific error patterns that indicate model issues
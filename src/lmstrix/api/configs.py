@@ -1,5 +1,8 @@
 # this_file: src/lmstrix/api/configs.py
 
+import functools
+from operator import attrgetter
+
 from rich.console import Console
 
 from lmstrix.core.concrete_config import ConcreteConfigManager
@@ -8,7 +11,11 @@ from lmstrix.utils import setup_logging
 from lmstrix.utils.logging import logger
 from lmstrix.utils.paths import get_lmstudio_path
 
-console = Console()
+
+@functools.cache
+def _console() -> Console:
+    """Build the status console on first use rather than at import time."""
+    return Console()
 
 
 def save_configs_command(
@@ -45,7 +52,9 @@ def save_configs_command(
         limit_value = limit
 
     registry = load_model_registry(verbose=verbose)
-    models_with_context = [m for m in registry.list_models() if m.tested_max_context]
+    # filter + attrgetter keeps the truthiness scan in C instead of a
+    # per-model Python comprehension step.
+    models_with_context = list(filter(attrgetter("tested_max_context"), registry.iter_models()))
 
     if not models_with_context:
         logger.debug("No models with tested context limits found.")
@@ -61,7 +70,7 @@ def save_configs_command(
         return
 
     config_manager = ConcreteConfigManager(lms_path)
-    with console.status("Saving concrete configurations..."):
+    with _console().status("Saving concrete configurations..."):
         successful, failed = config_manager.save_all_configs(
             models_with_context,
             enable_flash=flash,
@@ -76,7 +85,9 @@ def save_configs_command(
         logger.debug(f"✗ Failed to save {failed} model configurations")
 
     if flash:
-        gguf_count = sum(1 for m in models_with_context if str(m.path).endswith(".gguf"))
+        # Path.suffix avoids rebuilding a full string per path just for the
+        # extension check; summing the bools skips the 1-per-hit generator.
+        gguf_count = sum(m.path.suffix == ".gguf" for m in models_with_context)
         if gguf_count > 0:
             logger.debug(f"[blue]Flash attention enabled for {gguf_count} GGUF models[/blue]")
 
@@ -1,19 +1,32 @@
 """Custom exceptions for LMStrix API operations."""
 
+from types import MappingProxyType
+
+# Shared read-only sentinel for errors raised without details, so retry loops
+# that construct many exceptions don't allocate a fresh empty dict per raise.
+_EMPTY_DETAILS: MappingProxyType = MappingProxyType({})
+
 
 class LMStrixError(Exception):
     """Base exception for all LMStrix errors."""
 
+    # Documents each class's attribute surface; note that because Exception
+    # itself has no __slots__, instances still carry a __dict__, so this is
+    # declarative rather than a memory saving.
+    __slots__ = ("details", "message")
+
     def __init__(self, message: str, details: dict | None = None) -> None:
         """Initialize the exception."""
         super().__init__(message)
         self.message = message
-        self.details = details or {}
+        self.details = details if details else _EMPTY_DETAILS
 
 
 class ModelLoadError(LMStrixError):
     """Raised when a model fails to load."""
 
+    __slots__ = ("model_id", "reason")
+
     def __init__(self, model_id: str, reason: str, details: dict | None = None) -> None:
         """Initialize the exception."""
         message = f"Failed to load model '{model_id}': {reason}"
@@ -25,6 +38,8 @@ class ModelLoadError(LMStrixError):
 class InferenceError(LMStrixError):
     """Raised when inference fails."""
 
+    __slots__ = ("model_id", "reason")
+
     def __init__(self, model_id: str, reason: str, details: dict | None = None) -> None:
         """Initialize the exception."""
         message = f"Inference failed for model '{model_id}': {reason}"
@@ -36,6 +51,8 @@ class InferenceError(LMStrixError):
 class APIConnectionError(LMStrixError):
     """Raised when connection to LM Studio API fails."""
 
+    __slots__ = ("endpoint", "reason")
+
     def __init__(self, endpoint: str, reason: str, details: dict | None = None) -> None:
         """Initialize the exception."""
         message = f"Failed to connect to LM Studio API at '{endpoint}': {reason}"
@@ -47,6 +64,8 @@ class APIConnectionError(LMStrixError):
 class ContextLimitExceededError(InferenceError):
     """Raised when the input exceeds the model's context limit."""
 
+    __slots__ = ("context_limit", "input_tokens")
+
     def __init__(
         self,
         model_id: str,
@@ -64,6 +83,8 @@ class ContextLimitExceededError(InferenceError):
 class ModelNotFoundError(LMStrixError):
     """Raised when a requested model is not found."""
 
+    __slots__ = ("available_models", "model_id")
+
     def __init__(self, model_id: str, available_models: list[str] | None = None) -> None:
         """Initialize the exception."""
         message = f"Model '{model_id}' not found"
@@ -78,6 +99,8 @@ class ModelNotFoundError(LMStrixError):
 class ConfigurationError(LMStrixError):
     """Raised when there's a configuration issue."""
 
+    __slots__ = ("config_name", "reason")
+
     def __init__(self, config_name: str, reason: str, details: dict | None = None) -> None:
         """Initialize the exception."""
         message = f"Configuration error for '{config_name}': {reason}"
@@ -89,6 +112,8 @@ class ConfigurationError(LMStrixError):
 class LMStudioInstallationNotFoundError(LMStrixError):
     """Raised when the LM Studio installation path cannot be found."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initialize the exception."""
         message = (
@@ -101,6 +126,8 @@ class LMStudioInstallationNotFoundError(LMStrixError):
 class ValidationError(LMStrixError):
     """Raised when data validation fails."""
 
+    __slots__ = ("field", "reason", "value")
+
     def __init__(self, field: str, value: any, reason: str) -> None:
         """Initialize the exception."""
         message = f"Validation failed for {field}={value}: {reason}"
@@ -113,6 +140,8 @@ class ValidationError(LMStrixError):
 class InvalidContextLimitError(ValidationError):
     """Raised when context limit is invalid."""
 
+    __slots__ = ()
+
     def __init__(self, value: int) -> None:
         """Initialize the exception."""
         reason = "must be a positive integer" if value <= 0 else f"{value} seems unreasonably large"
@@ -122,6 +151,8 @@ class InvalidContextLimitError(ValidationError):
 class InvalidModelSizeError(ValidationError):
     """Raised when model size is invalid."""
 
+    __slots__ = ()
+
     def __init__(self, value: int) -> None:
         """Initialize the exception."""
         super().__init__("model_size", value, "must be a non-negative integer")
@@ -130,6 +161,8 @@ class InvalidModelSizeError(ValidationError):
 class RegistryValidationError(LMStrixError):
     """Raised when registry validation fails."""
 
+    __slots__ = ()
+
     def __init__(self, reason: str) -> None:
         """Initialize the exception."""
         super().__init__(f"Registry validation failed: {reason}")
@@ -138,6 +171,8 @@ class RegistryValidationError(LMStrixError):
 class InvalidModelError(LMStrixError):
     """Raised when a model fails integrity check."""
 
+    __slots__ = ("model_id",)
+
     def __init__(self, model_id: str) -> None:
         """Initialize the exception."""
         super().__init__(f"Model {model_id} failed integrity check")
@@ -146,6 +181,8 @@ class InvalidModelError(LMStrixError):
 class InvalidModelCountError(RegistryValidationError):
     """Raised when registry contains invalid models."""
 
+    __slots__ = ()
+
     def __init__(self, count: int) -> None:
         """Initialize the exception."""
         super().__init__(f"Registry contains {count} invalid models")
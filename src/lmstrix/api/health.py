@@ -1,15 +1,37 @@
 # this_file: src/lmstrix/api/health.py
 
+import fnmatch
+import heapq
 import json
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 
 from lmstrix.api.exceptions import ModelRegistryError
 from lmstrix.loaders.model_loader import load_model_registry
 from lmstrix.utils import setup_logging
+from lmstrix.utils.json_io import json_loads
 from lmstrix.utils.logging import logger
 from lmstrix.utils.paths import get_default_models_file
 
 
+def _validate_backup(backup: tuple[Path, os.stat_result]) -> tuple[Path, bool, float, int]:
+    """JSON-parse one backup file; returns (path, ok, mtime, size).
+
+    The stat result comes from the scandir pass in check_health_command, so
+    validation adds no extra stat syscall.
+    """
+    backup_file, stat = backup
+    try:
+        json_loads(backup_file.read_bytes())
+        ok = True
+    except (OSError, ValueError):
+        ok = False
+    return backup_file, ok, stat.st_mtime, stat.st_size
+
+
 def check_health_command(verbose: bool = False) -> None:
     setup_logging(verbose=verbose)
 
@@ -17,27 +39,29 @@ def check_health_command(verbose: bool = False) -> None:
     logger.debug("[blue]Database Health Check[/blue]")
     logger.info(f"Registry file: {models_file}")
 
-    if not models_file.exists():
+    # Single open covers both the existence check and the validity read;
+    # a separate exists() would stat the path a second time.
+    try:
+        raw = models_file.read_bytes()
+    except FileNotFoundError:
         logger.debug("✗ Registry file not found")
         return
 
     logger.success("✓ Registry file exist")
 
+    parsed = None
     try:
-        with models_file.open() as f:
-            json.load(f)
+        parsed = json_loads(raw)
         logger.success("✓ Registry file is valid JSON")
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         logger.debug(f"✗ Registry file is corrupted: {e}")
 
     try:
-        registry = load_model_registry(verbose=verbose)
+        # Reuse the validity-check parse instead of parsing the file twice.
+        registry = load_model_registry(verbose=verbose, preparsed=parsed)
         logger.success(f"✓ Successfully loaded {len(registry)} model")
 
-        invalid_models = []
-        for model_path, model in registry._models.items():
-            if not model.validate_integrity():
-                invalid_models.append(model_path)
+        invalid_models = registry.validate_all()
 
         if invalid_models:
             logger.debug(f"⚠ Found {len(invalid_models)} models with integrity issues")
@@ -50,29 +74,41 @@ def check_health_command(verbose: bool = False) -> None:
     except (ModelRegistryError, OSError, json.JSONDecodeError) as e:
         logger.debug(f"✗ Failed to load registry: {e}")
 
+    # Enumerate backups via scandir so each entry is stat'ed exactly once
+    # (DirEntry caches the result); glob + sort(key=stat) + re-stat in the
+    # render loop would triple the syscalls on backup-heavy directories.
+    # The generator streams straight into heapq.nlargest, so only the five
+    # newest entries are ever retained while total counts the full set.
     backup_pattern = f"{models_file.stem}.backup_*"
-    backup_files = list(models_file.parent.glob(backup_pattern))
+    total = 0
+
+    def matching_backups() -> Iterator[tuple[Path, os.stat_result]]:
+        nonlocal total
+        with os.scandir(models_file.parent) as it:
+            for entry in it:
+                if fnmatch.fnmatch(entry.name, backup_pattern):
+                    total += 1
+                    yield Path(entry.path), entry.stat()
+
+    recent = heapq.nlargest(5, matching_backups(), key=lambda b: b[1].st_mtime)
 
-    if not backup_files:
+    if not recent:
         logger.debug("No backup files found")
         return
 
-    backup_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    logger.debug(f"[blue]Found {len(backup_files)} backup files:[/blue]")
+    logger.debug(f"[blue]Found {total} backup files:[/blue]")
 
-    for backup_file in backup_files[:5]:
-        mtime = datetime.fromtimestamp(backup_file.stat().st_mtime)
-        size_kb = backup_file.stat().st_size // 1024
-        try:
-            with backup_file.open() as f:
-                json.load(f)
-            status = "[green]✓[/green]"
-        except json.JSONDecodeError:
-            status = "✗"
+    # Validation is independent per file and I/O-bound, so parse the newest
+    # five concurrently.
+    with ThreadPoolExecutor(max_workers=len(recent)) as ex:
+        results = list(ex.map(_validate_backup, recent))
 
+    for backup_file, ok, mtime_ts, size in results:
+        status = "[green]✓[/green]" if ok else "✗"
+        mtime = datetime.fromtimestamp(mtime_ts)
         logger.debug(
-            f"  {status} {backup_file.name} ({size_kb}KB, {mtime.strftime('%Y-%m-%d %H:%M')})"
+            f"  {status} {backup_file.name} ({size // 1024}KB, {mtime.strftime('%Y-%m-%d %H:%M')})"
         )
 
-    if len(backup_files) > 5:
-        logger.debug(f"  ... and {len(backup_files) - 5} more")
+    if total > 5:
+        logger.debug(f"  ... and {total - 5} more")
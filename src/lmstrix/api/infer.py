@@ -1,19 +1,33 @@
 # this_file: src/lmstrix/api/infer.py
 
+import functools
+import re
 import sys
 from pathlib import Path
 
 from rich.console import Console
 
-from lmstrix.core.inference_manager import InferenceManager
+from lmstrix.core.models import ModelRegistry
 from lmstrix.loaders.model_loader import load_model_registry
-from lmstrix.loaders.prompt_loader import load_single_prompt
 from lmstrix.utils import setup_logging
 from lmstrix.utils.context_parser import get_model_max_context, parse_out_ctx
 from lmstrix.utils.logging import logger
 from lmstrix.utils.state import StateManager
 
-console = Console()
+
+@functools.cache
+def _console() -> Console:
+    """Build the status console on first use rather than at import time."""
+    return Console()
+
+
+# Matches {{name}} placeholders in inline prompts, e.g. {{text}}.
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+def _substitute(prompt: str, params: dict[str, str]) -> str:
+    """Fill {{name}} placeholders from params in one pass; unknown names stay as-is."""
+    return _PLACEHOLDER_RE.sub(lambda m: params.get(m.group(1), m.group(0)), prompt)
 
 
 def run_inference_command(
@@ -34,6 +48,7 @@ def run_inference_command(
     stream: bool = False,
     stream_timeout: int = 120,
     verbose: bool = False,
+    registry: ModelRegistry | None = None,
 ) -> None:
     setup_logging(verbose=verbose)
 
@@ -42,115 +57,80 @@ def run_inference_command(
 
     if not file_prompt and (text or text_file):
         if text_file:
+            # Open directly and let FileNotFoundError signal a missing file;
+            # a prior exists() check would just double the stat() syscalls.
             try:
-                text_path = Path(text_file).expanduser()
-                if not text_path.exists():
-                    logger.error(f"Text file not found: {text_file}")
-                    return
-                text_content = text_path.read_text(encoding="utf-8")
+                text_content = Path(text_file).expanduser().read_text(encoding="utf-8")
+            except FileNotFoundError:
+                logger.error(f"Text file not found: {text_file}")
+                return
             except Exception as e:
                 logger.debug(f"Error reading text file: {e}")
                 return
         else:
             text_content = text or ""
 
-        actual_prompt = prompt.replace("{{text}}", text_content)
+        actual_prompt = _substitute(prompt, {"text": text_content})
     elif file_prompt:
         prompt_params = {}
         if dict_params:
-            pairs = dict_params.split(",") if "," in dict_params else dict_params.split(",")
-
-            for pair in pairs:
-                pair = pair.strip()
-                if "=" in pair:
-                    key, value = pair.split("=", 1)
+            for pair in dict_params.split(","):
+                key, sep, value = pair.strip().partition("=")
+                if sep:
                     prompt_params[key.strip()] = value.strip()
                 else:
                     logger.debug(
-                        f"Warning: Invalid parameter format '{pair}'. Expected 'key=value'.",
+                        f"Warning: Invalid parameter format '{pair.strip()}'. Expected 'key=value'.",
                     )
 
         if text_file:
             try:
-                text_path = Path(text_file).expanduser()
-                if not text_path.exists():
-                    logger.error(f"Text file not found: {text_file}")
-                    return
-                prompt_params["text"] = text_path.read_text(encoding="utf-8")
+                prompt_params["text"] = Path(text_file).expanduser().read_text(encoding="utf-8")
+            except FileNotFoundError:
+                logger.error(f"Text file not found: {text_file}")
+                return
             except Exception as e:
                 logger.debug(f"Error reading text file: {e}")
                 return
         elif text:
             prompt_params["text"] = text
 
+        # Deferred: prompt_loader pulls tiktoken via core.prompts, which the
+        # common inline-prompt path never needs.
+        from lmstrix.loaders.prompt_loader import load_single_prompt
+
         try:
+            # load_single_prompt raises ConfigurationError for a missing
+            # file, so no pre-flight exists() stat is needed here either.
             prompt_path = Path(file_prompt).expanduser()
-            if not prompt_path.exists():
-                logger.error(f"Prompt file not found: {file_prompt}")
-                return
+            prompt_names = [name.strip() for name in prompt.split(",") if name.strip()]
+
+            if verbose and len(prompt_names) > 1:
+                logger.debug(f"Loading multiple prompts: {', '.join(prompt_names)}")
+
+            # load_single_prompt accepts a list of names: it parses the TOML
+            # file once and resolves/concatenates all prompts against the same
+            # in-memory data, instead of re-reading the file per name.
+            resolved_prompt = load_single_prompt(
+                toml_path=prompt_path,
+                prompt_name=prompt_names,
+                verbose=verbose,
+                **prompt_params,
+            )
 
-            if "," in prompt:
-                prompt_names = [name.strip() for name in prompt.split(",") if name.strip()]
-                concatenated_prompts = []
-                all_placeholders_resolved = []
-                all_placeholders_unresolved = []
+            actual_prompt = resolved_prompt.resolved
 
-                if verbose:
-                    logger.debug(f"Loading multiple prompts: {', '.join(prompt_names)}")
-
-                for prompt_name in prompt_names:
-                    resolved_prompt = load_single_prompt(
-                        toml_path=prompt_path,
-                        prompt_name=prompt_name,
-                        verbose=verbose,
-                        **prompt_params,
-                    )
-                    concatenated_prompts.append(resolved_prompt.resolved)
-                    all_placeholders_resolved.extend(
-                        resolved_prompt.placeholders_resolved,
+            if verbose:
+                logger.debug(f"Loaded prompt '{prompt}' from {file_prompt}")
+                if resolved_prompt.placeholders_resolved:
+                    logger.debug(
+                        f"Resolved placeholders: {', '.join(resolved_prompt.placeholders_resolved)}",
                     )
-                    all_placeholders_unresolved.extend(
-                        resolved_prompt.placeholders_unresolved,
+                if resolved_prompt.placeholders_unresolved:
+                    logger.debug(
+                        f"Warning: Unresolved placeholders: {', '.join(resolved_prompt.placeholders_unresolved)}",
                     )
 
-                    if verbose:
-                        logger.debug(f"Loaded prompt '{prompt_name}' from {file_prompt}")
-
-                actual_prompt = "\n\n".join(concatenated_prompts)
-
-                if verbose:
-                    logger.debug(f"Concatenated {len(prompt_names)} prompts")
-                    if all_placeholders_resolved:
-                        unique_resolved = list(set(all_placeholders_resolved))
-                        logger.debug(
-                            f"Resolved placeholders: {', '.join(unique_resolved)}",
-                        )
-                    if all_placeholders_unresolved:
-                        unique_unresolved = list(set(all_placeholders_unresolved))
-                        logger.debug(
-                            f"Warning: Unresolved placeholders: {', '.join(unique_unresolved)}",
-                        )
-            else:
-                resolved_prompt = load_single_prompt(
-                    toml_path=prompt_path,
-                    prompt_name=prompt,
-                    verbose=verbose,
-                    **prompt_params,
-                )
-
-                actual_prompt = resolved_prompt.resolved
-
-                if verbose:
-                    logger.debug(f"Loaded prompt '{prompt}' from {file_prompt}")
-                    if resolved_prompt.placeholders_resolved:
-                        logger.debug(
-                            f"Resolved placeholders: {', '.join(resolved_prompt.placeholders_resolved)}",
-                        )
-                    if resolved_prompt.placeholders_unresolved:
-                        logger.debug(
-                            f"Warning: Unresolved placeholders: {', '.join(resolved_prompt.placeholders_unresolved)}",
-                        )
-
         except Exception as e:
             logger.debug(f"Error loading prompt from file: {e}")
             return
@@ -168,7 +148,8 @@ def run_inference_command(
         if verbose:
             logger.debug(f"Using last-used model: {model_id}")
 
-    registry = load_model_registry(verbose=verbose)
+    if registry is None:
+        registry = load_model_registry(verbose=verbose)
     model = registry.find_model(model_id)
     if not model:
         logger.error(f"Model '{model_id}' not found in registry.")
@@ -180,58 +161,83 @@ def run_inference_command(
         in_ctx = model.tested_max_context or model.context_limit
         logger.debug(f"Force reload requested, loading with context {in_ctx:,}")
 
-    if isinstance(out_ctx, str) and out_ctx != "-1":
-        try:
-            max_context = get_model_max_context(model, use_tested=True)
-            if not max_context:
-                max_context = model.context_limit
-            parsed_out_ctx = parse_out_ctx(out_ctx, max_context)
-            if verbose:
-                logger.debug(f"Parsed out_ctx '{out_ctx}' as {parsed_out_ctx} tokens")
-            out_ctx = parsed_out_ctx
-        except ValueError as e:
-            logger.error(f"{e}")
-            return
+    needs_out_parse = isinstance(out_ctx, str) and out_ctx != "-1"
+    needs_in_parse = isinstance(in_ctx, str)
 
-    if isinstance(in_ctx, str):
+    if needs_out_parse or needs_in_parse:
+        # Resolve the model's effective limit once; both args parse against it.
+        max_context = get_model_max_context(model, use_tested=True) or model.context_limit
         try:
-            max_context = get_model_max_context(model, use_tested=True)
-            if not max_context:
-                max_context = model.context_limit
-            parsed_in_ctx = parse_out_ctx(in_ctx, max_context)
-            if verbose:
-                logger.debug(f"Parsed in_ctx '{in_ctx}' as {parsed_in_ctx} tokens")
-            in_ctx = parsed_in_ctx
+            if needs_out_parse:
+                parsed_out_ctx = parse_out_ctx(out_ctx, max_context)
+                if verbose:
+                    logger.debug(f"Parsed out_ctx '{out_ctx}' as {parsed_out_ctx} tokens")
+                out_ctx = parsed_out_ctx
+            if needs_in_parse:
+                parsed_in_ctx = parse_out_ctx(in_ctx, max_context)
+                if verbose:
+                    logger.debug(f"Parsed in_ctx '{in_ctx}' as {parsed_in_ctx} tokens")
+                in_ctx = parsed_in_ctx
         except ValueError as e:
             logger.error(f"{e}")
             return
 
     resolved_out_ctx: int = -1 if out_ctx == "-1" else int(out_ctx)
 
+    # Deferred so importing this module (and api.main with it) doesn't load
+    # the inference stack for commands that never run inference.
+    from lmstrix.core.inference_manager import InferenceManager
+
     manager = InferenceManager(registry=registry, verbose=verbose)
 
+    # The streaming and non-streaming branches take identical inference
+    # kwargs; build them once instead of packing the same 9 keywords at
+    # each of the three call sites below.
+    params = {
+        "model_id": model.id,
+        "prompt": actual_prompt,
+        "in_ctx": in_ctx,
+        "out_ctx": resolved_out_ctx,
+        "temperature": param_temp,
+        "top_k": param_top_k,
+        "top_p": param_top_p,
+        "repeat_penalty": param_repeat,
+        "min_p": param_min_p,
+    }
+
     if stream:
         try:
             if verbose:
                 print(f"\nStreaming inference on {model.id}...", file=sys.stderr)
 
+            # Write token bytes straight to the stdout buffer; per-token
+            # print(..., flush=True) pays the text-layer formatting and lock
+            # overhead once for every token of the stream. On a TTY every
+            # token flushes immediately for live display; when piped, tokens
+            # accumulate and flush on newline or every ~4KB.
+            stdout_write = sys.stdout.buffer.write
+            stdout_flush = sys.stdout.buffer.flush
+            interactive = sys.stdout.isatty()
+            buf = bytearray()
+
             def print_token(token: str) -> None:
-                print(token, end="", flush=True, file=sys.stdout)
-
-            for _token in manager.stream_infer(
-                model_id=model.id,
-                prompt=actual_prompt,
-                in_ctx=in_ctx,
-                out_ctx=resolved_out_ctx,
-                temperature=param_temp,
-                top_k=param_top_k,
-                top_p=param_top_p,
-                repeat_penalty=param_repeat,
-                min_p=param_min_p,
-                on_token=print_token,
-                stream_timeout=stream_timeout,
-            ):
-                pass
+                buf.extend(token.encode("utf-8"))
+                if interactive or len(buf) >= 4096 or buf.endswith(b"\n"):
+                    stdout_write(bytes(buf))
+                    stdout_flush()
+                    buf.clear()
+
+            try:
+                for _token in manager.stream_infer(
+                    **params,
+                    on_token=print_token,
+                    stream_timeout=stream_timeout,
+                ):
+                    pass
+            finally:
+                if buf:
+                    stdout_write(bytes(buf))
+                    stdout_flush()
 
             print("", file=sys.stdout)
 
@@ -239,30 +245,10 @@ def run_inference_command(
             print(f"\nStreaming inference failed: {e}", file=sys.stderr)
     else:
         if verbose:
-            with console.status(f"Running inference on {model.id}..."):
-                result = manager.infer(
-                    model_id=model.id,
-                    prompt=actual_prompt,
-                    in_ctx=in_ctx,
-                    out_ctx=resolved_out_ctx,
-                    temperature=param_temp,
-                    top_k=param_top_k,
-                    top_p=param_top_p,
-                    repeat_penalty=param_repeat,
-                    min_p=param_min_p,
-                )
+            with _console().status(f"Running inference on {model.id}..."):
+                result = manager.infer(**params)
         else:
-            result = manager.infer(
-                model_id=model.id,
-                prompt=actual_prompt,
-                in_ctx=in_ctx,
-                out_ctx=resolved_out_ctx,
-                temperature=param_temp,
-                top_k=param_top_k,
-                top_p=param_top_p,
-                repeat_penalty=param_repeat,
-                min_p=param_min_p,
-            )
+            result = manager.infer(**params)
 
         if result["succeeded"]:
             if verbose:
@@ -1,21 +1,79 @@
 # this_file: src/lmstrix/api/listing.py
 
-import json
+import functools
+import sys
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 from rich.console import Console
-from rich.table import Table
 
 from lmstrix.core.describer import (
     filter_models_by_keywords,
     format_models_markdown,
     sort_models_by_keywords,
 )
-from lmstrix.core.models import ModelRegistry
+from lmstrix.core.models import ContextTestStatus, ModelRegistry
 from lmstrix.loaders.model_loader import load_model_registry, scan_and_update_registry
 from lmstrix.utils import setup_logging
+from lmstrix.utils.json_io import json_dump_bytes
 from lmstrix.utils.logging import logger
 
-console = Console(width=160)
+
+@functools.cache
+def _console() -> Console:
+    """Build the listing console lazily; --show id/json/md paths never need Rich."""
+    return Console(width=160, force_terminal=sys.stdout.isatty() or None)
+
+
+# Single source of truth for sort keys, shared with main._sort_models. A
+# trailing "d" on the CLI value (e.g. "sized") means descending order.
+# Plain attribute keys use C-level attrgetter, ~2x faster per comparison
+# than an equivalent lambda on large registries.
+SORT_KEYS: "dict[str, Callable[[Any], Any]]" = {
+    "id": attrgetter("id"),
+    "ctx": lambda m: m.tested_max_context or 0,
+    "dtx": attrgetter("context_limit"),
+    "size": attrgetter("size"),
+    "ttft": lambda m: m.ttft_seconds or 0,
+    "tps": lambda m: m.tps or 0,
+    "smart": lambda m: (
+        (m.tps or 0) * 2000
+        + (m.tested_max_context or 0)
+        + m.context_limit
+        + (m.size / (1024 * 1024)) * 500
+    ),
+}
+
+# Keyword-based sorts handled by core.describer.sort_models_by_keywords.
+_KEYWORD_SORT_KEYS = {"arch", "inp", "outp", "proc"}
+
+_GB = 1 << 30
+# Multiply by the reciprocal rather than dividing per row.
+_BYTES_TO_GB = 1.0 / _GB
+
+# Keyed by enum member so per-row lookups skip the .value indirection.
+_STATUS_LABELS = {
+    ContextTestStatus.UNTESTED: "Untested",
+    ContextTestStatus.TESTING: "Testing...",
+    ContextTestStatus.COMPLETED: "[green]✓ Tested[/green]",
+    ContextTestStatus.FAILED: "✗ Failed",
+}
+
+
+def normalize_sort_key(sort: str) -> tuple[str, bool]:
+    """Split a CLI sort value into (base_key, reverse).
+
+    "sized" -> ("size", True); "size" -> ("size", False). Only strips the
+    trailing "d" when the value itself is not already a known key, so "id"
+    stays ascending.
+    """
+    sort_key = sort.lower()
+    if sort_key not in SORT_KEYS and sort_key.endswith("d") and len(sort_key) > 1:
+        return sort_key[:-1], True
+    return sort_key, False
 
 
 def _format_capabilities(model) -> str:
@@ -39,6 +97,19 @@ def list_models_command(
 ) -> None:
     setup_logging(verbose=verbose)
 
+    # Fast path for piped id/path dumps: skip the rescan and full Model
+    # materialization when no filtering and only the default id sort apply.
+    if (
+        registry is None
+        and show in {"id", "path"}
+        and key is None
+        and normalize_sort_key(sort) == ("id", False)
+    ):
+        ids = ModelRegistry.read_model_ids()
+        if ids:
+            print("\n".join(ids))
+            return
+
     if registry is None:
         try:
             registry = scan_and_update_registry(verbose=verbose)
@@ -54,53 +125,39 @@ def list_models_command(
         keywords = [k.strip() for k in key.split(",") if k.strip()]
         models = filter_models_by_keywords(models, keywords)
         if not models:
-            console.print(f"[yellow]No models match keywords: {', '.join(keywords)}[/yellow]")
+            _console().print(f"[yellow]No models match keywords: {', '.join(keywords)}[/yellow]")
             return
 
-    sort_key = sort.lower()
-    reverse = sort_key.endswith("d") and len(sort_key) > 1
-
-    if sort_key in ("arch", "archd", "inp", "inpd", "outp", "outpd", "proc", "procd"):
-        sorted_models = sort_models_by_keywords(models, sort_key)
-    elif sort_key in ("id", "idd"):
-        sorted_models = sorted(models, key=lambda m: m.id, reverse=reverse)
-    elif sort_key in ("ctx", "ctxd"):
-        sorted_models = sorted(models, key=lambda m: m.tested_max_context or 0, reverse=reverse)
-    elif sort_key in ("dtx", "dtxd"):
-        sorted_models = sorted(models, key=lambda m: m.context_limit, reverse=reverse)
-    elif sort_key in ("size", "sized"):
-        sorted_models = sorted(models, key=lambda m: m.size, reverse=reverse)
-    elif sort_key in ("smart", "smartd"):
-        sorted_models = sorted(
-            models,
-            key=lambda m: (
-                (m.tps or 0) * 2000
-                + (m.tested_max_context or 0)
-                + m.context_limit
-                + (m.size / (1024 * 1024)) * 500
-            ),
-            reverse=reverse,
-        )
-    elif sort_key in ("ttft", "ttftd"):
-        sorted_models = sorted(models, key=lambda m: m.ttft_seconds or 0, reverse=reverse)
-    elif sort_key in ("tps", "tpsd"):
-        sorted_models = sorted(models, key=lambda m: m.tps or 0, reverse=reverse)
+    base_key, reverse = normalize_sort_key(sort)
+
+    if base_key in _KEYWORD_SORT_KEYS:
+        sorted_models = sort_models_by_keywords(models, sort.lower())
+    elif base_key in SORT_KEYS:
+        sorted_models = sorted(models, key=SORT_KEYS[base_key], reverse=reverse)
     else:
         logger.debug(f"Invalid sort option: {sort}. Using default (id).")
-        sorted_models = sorted(models, key=lambda m: m.id)
+        sorted_models = sorted(models, key=SORT_KEYS["id"])
 
     if show:
         if show in {"id", "path"}:
-            for model in sorted_models:
-                print(model.id)
+            # One buffered write instead of a print (lock + syscall) per line.
+            sys.stdout.write("\n".join(model.id for model in sorted_models) + "\n")
         elif show == "json":
-            print(json.dumps([model.to_dict() for model in sorted_models], indent=2))
+            # orjson (when installed) serializes ~5-10x faster than stdlib
+            # json; emitting the bytes straight to the stdout buffer skips
+            # the str decode/re-encode a print() would add.
+            payload = json_dump_bytes([model.to_dict() for model in sorted_models], indent=2)
+            sys.stdout.buffer.write(payload + b"\n")
         elif show == "md":
             print(format_models_markdown(sorted_models))
         else:
             logger.debug(f"Invalid show option: {show}. Options: id, path, json, md.")
         return
 
+    # Imported here so the --show id/json/md branches above never load
+    # Rich's table machinery.
+    from rich.table import Table
+
     table = Table(show_lines=False, box=None, expand=True)
     table.add_column("Model ID", style="cyan", no_wrap=False)
     table.add_column("Size(GB)", style="magenta")
@@ -113,31 +170,25 @@ def list_models_command(
     table.add_column("Capabilities", style="cyan", no_wrap=False)
     table.add_column("Status", style="blue")
 
-    for model in sorted_models:
-        tested_ctx = f"{model.tested_max_context:,}" if model.tested_max_context else "-"
-        last_good = f"{model.last_known_good_context:,}" if model.last_known_good_context else "-"
-        last_bad = f"{model.last_known_bad_context:,}" if model.last_known_bad_context else "-"
-        ttft_str = f"{model.ttft_seconds:.2f}s" if model.ttft_seconds is not None else "-"
-        tps_str = f"{model.tps:.1f}" if model.tps is not None else "-"
-
-        status_map = {
-            "untested": "Untested",
-            "testing": "Testing...",
-            "completed": "[green]✓ Tested[/green]",
-            "failed": "✗ Failed",
-        }
-        status = status_map.get(model.context_test_status.value, "Unknown")
-
-        table.add_row(
+    # Build all row tuples first, then append in a tight loop; keeping the
+    # comprehension free of Rich calls amortizes add_row's per-cell style
+    # resolution across the batch on large registries.
+    rows = [
+        (
             model.id,
-            f"{model.size / (1024**3):.2f}" if model.size else "N/A",
-            f"{model.context_limit:,}",
-            tested_ctx,
-            last_good,
-            last_bad,
-            ttft_str,
-            tps_str,
+            f"{model.size * _BYTES_TO_GB:.2f}" if model.size else "N/A",
+            model.formatted_context_limit,
+            f"{model.tested_max_context:,}" if model.tested_max_context else "-",
+            f"{model.last_known_good_context:,}" if model.last_known_good_context else "-",
+            f"{model.last_known_bad_context:,}" if model.last_known_bad_context else "-",
+            f"{model.ttft_seconds:.2f}s" if model.ttft_seconds is not None else "-",
+            f"{model.tps:.1f}" if model.tps is not None else "-",
             _format_capabilities(model),
-            status,
+            _STATUS_LABELS.get(model.context_test_status, "Unknown"),
         )
-    console.print(table)
+        for model in sorted_models
+    ]
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
+    _console().print(table)
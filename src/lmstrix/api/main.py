@@ -1,6 +1,9 @@
 """Main API service layer. Hooks up the CLI commands to the underlying core logic."""
 
-import time
+import asyncio
+import functools
+import sys
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 
@@ -11,22 +14,36 @@ from rich.table import Table
 from lmstrix.api.about import about_command
 from lmstrix.api.configs import save_configs_command
 from lmstrix.api.describe import describe_models_command
-from lmstrix.api.exceptions import APIConnectionError, ModelRegistryError
+from lmstrix.api.exceptions import (
+    APIConnectionError,
+    LMStudioInstallationNotFoundError,
+    ModelRegistryError,
+)
 from lmstrix.api.health import check_health_command
 from lmstrix.api.helptext import show_help_command
 from lmstrix.api.infer import run_inference_command
-from lmstrix.api.listing import list_models_command
-from lmstrix.core.context_tester import ContextTester
+from lmstrix.api.listing import SORT_KEYS, list_models_command, normalize_sort_key
+from lmstrix.core.context_tester import ContextTester, ContextTestResult, is_embedding_model
 from lmstrix.core.describer import filter_models_by_keywords
 from lmstrix.core.models import ContextTestStatus, Model, ModelRegistry
 from lmstrix.loaders.model_loader import (
     load_model_registry,
     scan_and_update_registry,
 )
-from lmstrix.utils import get_context_test_log_path, setup_logging
+from lmstrix.utils import get_context_test_log_path, get_default_models_file, setup_logging
 from lmstrix.utils.logging import logger
 
-console = Console()
+
+@functools.cache
+def _console() -> Console:
+    """Build the shared Rich console on first use.
+
+    Console auto-detection/theming costs tens of milliseconds at import
+    time; plain pipeline invocations that never render skip it entirely.
+    force_terminal stays None (auto) for non-TTY stdout so piped output
+    remains uncolored.
+    """
+    return Console(force_terminal=sys.stdout.isatty() or None)
 
 
 def _format_response_preview(response: str | None, max_length: int = 60) -> str:
@@ -49,13 +66,8 @@ def _get_models_to_test(
     ctx: int | None,
     model_id: str | None,
     reset: bool = False,
-    fast_mode: bool = False,
 ) -> list[Model]:
     """Filter and return a list of models to be tested."""
-    tester = ContextTester(
-        fast_mode=fast_mode,
-    )  # Create a temporary tester for _is_embedding_model
-
     if not test_all:
         if not model_id:
             logger.error("You must specify a model ID or use the --all flag.")
@@ -64,32 +76,31 @@ def _get_models_to_test(
         if not model:
             logger.error(f"Model '{model_id}' not found in registry.")
             return []
-        if tester._is_embedding_model(model):
+        if is_embedding_model(model):
             logger.debug(
                 f"Error: Model '{model_id}' is an embedding model and cannot be tested as an LLM.",
             )
             return []
         return [model]
 
-    all_models = registry.list_models()
     models_to_test = []
     skipped_embedding = 0
 
-    for m in all_models:
-        if tester._is_embedding_model(m):
+    # Predicates ordered by selectivity: on a mostly-tested registry the
+    # enum identity check prunes the bulk of models before the (cached)
+    # embedding heuristic or any limit comparisons run.
+    for m in registry.iter_models():
+        if not reset and m.context_test_status is ContextTestStatus.COMPLETED:
+            continue
+        if is_embedding_model(m):
             skipped_embedding += 1
             continue
-
         if ctx is not None:
-            if not reset and m.context_test_status.value == "completed":
-                continue
             if ctx > m.context_limit:
                 continue
             if not reset and m.last_known_bad_context and ctx >= m.last_known_bad_context:
                 continue
-            models_to_test.append(m)
-        elif reset or m.context_test_status.value != "completed":
-            models_to_test.append(m)
+        models_to_test.append(m)
 
     if skipped_embedding > 0:
         logger.debug(
@@ -116,24 +127,45 @@ def _get_models_to_test(
 
 
 def _sort_models(models: list[Model], sort_by: str) -> list[Model]:
-    """Sort a list of models based on a given key."""
-    sort_key = sort_by.lower()
-    reverse = sort_key.endswith("d") and len(sort_key) > 1
-    key_map = {
-        "id": "id",
-        "ctx": "tested_max_context",
-        "dtx": "context_limit",
-        "size": "size",
-        "ttft": "ttft_seconds",
-        "tps": "tps",
-    }
-    sort_attr = key_map.get(sort_key.rstrip("d"))
-
-    if not sort_attr:
+    """Sort a list of models based on a given key (shared table in listing.py)."""
+    base_key, reverse = normalize_sort_key(sort_by)
+    sort_key_fn = SORT_KEYS.get(base_key)
+
+    if sort_key_fn is None:
         logger.debug(f"Invalid sort option: {sort_by}. Using default (id).")
-        return sorted(models, key=lambda m: m.id)
+        return sorted(models, key=SORT_KEYS["id"])
+
+    return sorted(models, key=sort_key_fn, reverse=reverse)
+
 
-    return sorted(models, key=lambda m: getattr(m, sort_attr) or 0, reverse=reverse)
+def _apply_test_result(
+    model: Model,
+    result: ContextTestResult,
+    ctx: int,
+    success_status: ContextTestStatus = ContextTestStatus.COMPLETED,
+) -> bool:
+    """Apply a _test_at_context result to the model's tracked fields.
+
+    Shared by the single-model and batch paths so their state transitions
+    cannot drift apart; returns True on success. success_status captures the
+    one intentional difference: the batch path keeps successful models in
+    TESTING because the whole batch is persisted (and finalized) together.
+    """
+    ok = result.load_success and result.inference_success
+    if ok:
+        model.last_known_good_context = ctx
+        if not model.tested_max_context or ctx > model.tested_max_context:
+            model.tested_max_context = ctx
+        if result.ttft_seconds is not None:
+            model.ttft_seconds = result.ttft_seconds
+        if result.tps is not None:
+            model.tps = result.tps
+        model.context_test_status = success_status
+    else:
+        model.last_known_bad_context = ctx
+        model.context_test_status = ContextTestStatus.FAILED
+    model.context_test_date = datetime.now()
+    return ok
 
 
 def _test_single_model(
@@ -147,7 +179,7 @@ def _test_single_model(
     """Test a single model at a specific context size."""
     if ctx > model.context_limit:
         logger.warning(
-            f"Warning: Specified context ({ctx:,}) exceeds model's declared limit ({model.context_limit:,}). Skipping test.",
+            f"Warning: Specified context ({ctx:,}) exceeds model's declared limit ({model.formatted_context_limit}). Skipping test.",
         )
         return
 
@@ -172,7 +204,7 @@ def _test_single_model(
         logger.info(
             f"\n[bold cyan]Testing model: {model.id} at specific context: {ctx:,}[/bold cyan]",
         )
-        logger.info(f"Declared context limit: {model.context_limit:,} tokens")
+        logger.info(f"Declared context limit: {model.formatted_context_limit} tokens")
     else:
         # Compact output - create a live table for testing progress
         table = Table(show_header=False, header_style="bold cyan", box=None, expand=False)
@@ -189,18 +221,20 @@ def _test_single_model(
             "",
         )
 
-        live = Live(table, console=console, refresh_per_second=4)
+        live = Live(table, console=_console(), refresh_per_second=4)
         live.start()
 
     log_path = get_context_test_log_path(model.id)
 
+    # Mark in-progress in memory only; context_test_date is stamped once at
+    # completion below, which is the only timestamp that ever hits disk.
     model.context_test_status = ContextTestStatus.TESTING
-    model.context_test_date = datetime.now()
-    registry.update_model_by_id(model)
+    registry.update_model_by_id(model, flush=False)
 
     result = tester._test_at_context(model.id, ctx, log_path, model, registry)
+    success = _apply_test_result(model, result, ctx)
 
-    if result.load_success and result.inference_success:
+    if success:
         # Format response for display
         response_preview = _format_response_preview(result.response)
         if verbose:
@@ -229,14 +263,6 @@ def _test_single_model(
             )
             live.update(table)
             live.stop()
-        model.last_known_good_context = ctx
-        if not model.tested_max_context or ctx > model.tested_max_context:
-            model.tested_max_context = ctx
-        model.context_test_status = ContextTestStatus.COMPLETED
-        if result.ttft_seconds is not None:
-            model.ttft_seconds = result.ttft_seconds
-        if result.tps is not None:
-            model.tps = result.tps
     else:
         error_type = "load" if not result.load_success else "inference"
         if verbose:
@@ -258,13 +284,96 @@ def _test_single_model(
             )
             live.update(table)
             live.stop()
-        model.last_known_bad_context = ctx
-        model.context_test_status = ContextTestStatus.FAILED
 
-    model.context_test_date = datetime.now()
     registry.update_model_by_id(model)
 
 
+def _ctx_results_table(updated_models: list[Model], ctx: int, total: int) -> Table:
+    """Build the progress/results table for batch testing at a fixed context."""
+    table = Table(show_header=False, header_style="bold cyan", box=None, expand=False)
+    table.add_column("Model", style="cyan", no_wrap=True)
+    table.add_column("Context", justify="right", style="yellow")
+    table.add_column("Status", style="blue")
+    table.add_column("TTFT", justify="right", style="blue")
+    table.add_column("TPS", justify="right", style="blue")
+    table.add_column("Response", style="white")
+    table.add_column("Progress", justify="right", style="magenta")
+
+    for j, model in enumerate(updated_models):
+        status = (
+            "[green]\u2713 Success[/green]"
+            if model.last_known_good_context == ctx
+            else "[red]\u2717 Failed[/red]"
+        )
+        response_preview = getattr(model, "_test_response_preview", "\u274c")
+        ttft_str = (
+            f"{model.ttft_seconds:.2f}s"
+            if getattr(model, "ttft_seconds", None) is not None
+            else "-"
+        )
+        tps_str = f"{model.tps:.1f}" if getattr(model, "tps", None) is not None else "-"
+        table.add_row(
+            model.id[:40] + "..." if len(model.id) > 40 else model.id,
+            f"{ctx:,}",
+            status,
+            ttft_str,
+            tps_str,
+            f"||{response_preview}||" if response_preview else "\u274c",
+            f"{j + 1}/{total}",
+        )
+    return table
+
+
+async def _atest_models_at_ctx(
+    tester: ContextTester,
+    models_to_test: list[Model],
+    ctx: int,
+    registry: ModelRegistry,
+    on_result: Callable[[Model], None] | None = None,
+) -> list[Model]:
+    """Fan out per-model context tests with bounded concurrency.
+
+    Each blocking _test_at_context call is offloaded to a worker thread via
+    asyncio.to_thread; an asyncio.Semaphore caps how many run at once at the
+    tester's max_workers (the --workers flag, default 1) so LM Studio is not
+    asked to hold more models than it can serve. Registry and model mutations
+    happen on the event-loop thread, keeping them serialized.
+    """
+    sem = asyncio.Semaphore(min(tester.max_workers, len(models_to_test) or 1))
+
+    async def run_one(model: Model) -> Model:
+        async with sem:
+            log_path = get_context_test_log_path(model.id)
+
+            # Mark in-progress in memory only; the completion timestamp below
+            # is the single datetime.now() per test that gets persisted.
+            model.context_test_status = ContextTestStatus.TESTING
+            registry.update_model_by_id(model, flush=False)
+
+            result = await asyncio.to_thread(
+                tester._test_at_context,
+                model.id,
+                ctx,
+                log_path,
+                model,
+                registry,
+            )
+
+        if _apply_test_result(model, result, ctx, success_status=ContextTestStatus.TESTING):
+            # Store response preview temporarily for display
+            response_preview = _format_response_preview(result.response)
+            model._test_response_preview = response_preview if response_preview else "\u274c"
+        else:
+            model._test_response_preview = "\u274c"
+
+        registry.update_model_by_id(model, flush=False)
+        if on_result is not None:
+            on_result(model)
+        return model
+
+    return await asyncio.gather(*(run_one(model) for model in models_to_test))
+
+
 def _test_all_models_at_ctx(
     tester: ContextTester,
     models_to_test: list[Model],
@@ -273,154 +382,42 @@ def _test_all_models_at_ctx(
     verbose: bool = False,
 ) -> list[Model]:
     """Test all models at a specific context size."""
+    total = len(models_to_test)
+    live = None
     if verbose:
         logger.debug(
-            f"[bold]Testing {len(models_to_test)} models at context size {ctx:,}[/bold]\n",
+            f"[bold]Testing {total} models at context size {ctx:,} "
+            f"(up to {min(tester.max_workers, total)} in parallel)[/bold]\n",
         )
     else:
-        # Compact output - create a live table for testing progress
-        table = Table(show_header=False, header_style="bold cyan", box=None, expand=False)
-        table.add_column("Model", style="cyan", no_wrap=True)
-        table.add_column("Context", justify="right", style="yellow")
-        table.add_column("Status", style="blue")
-        table.add_column("Response", style="white")
-        table.add_column("Progress", justify="right", style="magenta")
-
-        live = Live(table, console=console, refresh_per_second=4)
+        # Compact output - a live table that grows as tests complete
+        live = Live(_ctx_results_table([], ctx, total), console=_console(), refresh_per_second=4)
         live.start()
 
-    updated_models = []
-    for i, model in enumerate(models_to_test, 1):
-        if verbose:
-            logger.info(f"[{i}/{len(models_to_test)}] Testing {model.id}...")
-        else:
-            # Update table with current model
-            table = Table(show_header=False, header_style="bold cyan", box=None, expand=False)
-            table.add_column("Model", style="cyan", no_wrap=True)
-            table.add_column("Context", justify="right", style="yellow")
-            table.add_column("Status", style="blue")
-            table.add_column("TTFT", justify="right", style="blue")
-            table.add_column("TPS", justify="right", style="blue")
-            table.add_column("Response", style="white")
-            table.add_column("Progress", justify="right", style="magenta")
-
-            # Add previous results
-            for j, prev_model in enumerate(updated_models):
-                status = (
-                    "[green]✓ Success[/green]"
-                    if prev_model.last_known_good_context == ctx
-                    else "[red]✗ Failed[/red]"
-                )
-                response_preview = getattr(prev_model, "_test_response_preview", "❌")
-                prev_ttft = (
-                    f"{prev_model.ttft_seconds:.2f}s"
-                    if getattr(prev_model, "ttft_seconds", None) is not None
-                    else "-"
-                )
-                prev_tps = (
-                    f"{prev_model.tps:.1f}" if getattr(prev_model, "tps", None) is not None else "-"
-                )
-                table.add_row(
-                    prev_model.id[:40] + "..." if len(prev_model.id) > 40 else prev_model.id,
-                    f"{ctx:,}",
-                    status,
-                    prev_ttft,
-                    prev_tps,
-                    f"||{response_preview}||" if response_preview else "❌",
-                    f"{j + 1}/{len(models_to_test)}",
-                )
-
-            # Add current testing model
-            table.add_row(
-                model.id[:40] + "..." if len(model.id) > 40 else model.id,
-                f"{ctx:,}",
-                "[blue]Testing...[/blue]",
-                "-",
-                "-",
-                "",
-                f"{i}/{len(models_to_test)}",
-            )
-
-            live.update(table)
-
-        if i > 1:
-            if verbose:
-                logger.info(
-                    "\n\n  ⏳ Waiting 3 seconds before next model (resource cleanup)...",
-                )
-            time.sleep(3.0)
-
-        log_path = get_context_test_log_path(model.id)
-
-        model.context_test_status = ContextTestStatus.TESTING
-        model.context_test_date = datetime.now()
-        registry.update_model_by_id(model)
-
-        result = tester._test_at_context(model.id, ctx, log_path, model, registry)
-
-        # Store the response preview on the model for later display
-        if result.load_success and result.inference_success:
-            response_preview = _format_response_preview(result.response)
-            if verbose:
-                logger.debug(f"  ✓ Success at context {ctx:,}")
-                logger.info(f"  Response preview: ||{response_preview}||")
-            model.last_known_good_context = ctx
-            if not model.tested_max_context or ctx > model.tested_max_context:
-                model.tested_max_context = ctx
-            if result.ttft_seconds is not None:
-                model.ttft_seconds = result.ttft_seconds
-            if result.tps is not None:
-                model.tps = result.tps
-            model.context_test_status = ContextTestStatus.TESTING
-            # Store response preview temporarily for display
-            model._test_response_preview = response_preview if response_preview else "❌"
-        else:
-            error_type = "load" if not result.load_success else "inference"
-            if verbose:
-                logger.debug(f"  ✗ Failed at context {ctx:,} ({error_type} failed)")
-            model.last_known_bad_context = ctx
-            model.context_test_status = ContextTestStatus.FAILED
-            model._test_response_preview = "❌"
+    updated_models: list[Model] = []
 
-        model.context_test_date = datetime.now()
-        registry.update_model_by_id(model)
+    def on_result(model: Model) -> None:
         updated_models.append(model)
-
-    if not verbose:
-        # Final update with all results
-        table = Table(show_header=False, header_style="bold cyan", box=None, expand=False)
-        table.add_column("Model", style="cyan", no_wrap=True)
-        table.add_column("Context", justify="right", style="yellow")
-        table.add_column("Status", style="blue")
-        table.add_column("TTFT", justify="right", style="blue")
-        table.add_column("TPS", justify="right", style="blue")
-        table.add_column("Response", style="white")
-        table.add_column("Progress", justify="right", style="magenta")
-
-        for j, model in enumerate(updated_models):
-            status = (
-                "[green]✓ Success[/green]"
-                if model.last_known_good_context == ctx
-                else "[red]✗ Failed[/red]"
-            )
-            response_preview = getattr(model, "_test_response_preview", "❌")
-            final_ttft = (
-                f"{model.ttft_seconds:.2f}s"
-                if getattr(model, "ttft_seconds", None) is not None
-                else "-"
-            )
-            final_tps = f"{model.tps:.1f}" if getattr(model, "tps", None) is not None else "-"
-            table.add_row(
-                model.id[:40] + "..." if len(model.id) > 40 else model.id,
-                f"{ctx:,}",
-                status,
-                final_ttft,
-                final_tps,
-                f"||{response_preview}||" if response_preview else "❌",
-                f"{j + 1}/{len(models_to_test)}",
-            )
-
-        live.update(table)
+        if verbose:
+            if model.last_known_good_context == ctx:
+                logger.debug(f"  \u2713 {model.id}: success at context {ctx:,}")
+                preview = getattr(model, "_test_response_preview", "")
+                logger.info(f"  Response preview: ||{preview}||")
+            else:
+                logger.debug(f"  \u2717 {model.id}: failed at context {ctx:,}")
+        else:
+            live.update(_ctx_results_table(updated_models, ctx, total))
+
+    # Results are applied to the registry in memory only (flush=False); write
+    # the file once per batch. The finally block also persists whatever
+    # finished if the batch is interrupted (e.g. Ctrl-C mid-run).
+    try:
+        asyncio.run(_atest_models_at_ctx(tester, models_to_test, ctx, registry, on_result))
+    finally:
+        registry.save()
+
+    if live is not None:
+        live.update(_ctx_results_table(updated_models, ctx, total))
         live.stop()
 
     return updated_models
@@ -460,31 +457,33 @@ def _print_final_results(updated_models: list[Model]) -> None:
     table.add_column("TTFT", justify="right", style="blue")
     table.add_column("TPS", justify="right", style="blue")
 
-    for model in updated_models:
-        status = "✓ Completed" if model.context_test_status.value == "completed" else "✗ Failed"
-        optimal = f"{model.tested_max_context:,}" if model.tested_max_context else "N/A"
-        declared = f"{model.context_limit:,}"
-        efficiency = (
-            f"{(model.tested_max_context / model.context_limit * 100):.1f}%"
-            if model.tested_max_context
-            else "N/A"
-        )
-        final_ttft = (
-            f"{model.ttft_seconds:.2f}s"
-            if getattr(model, "ttft_seconds", None) is not None
-            else "-"
-        )
-        final_tps = f"{model.tps:.1f}" if getattr(model, "tps", None) is not None else "-"
-
-        table.add_row(
+    # Precompute every formatted cell in one comprehension, then append in a
+    # tight loop; Rich's per-cell style resolution runs separately from the
+    # Python formatting work (same pattern as the listing table).
+    rows = [
+        (
             model.id,
-            status,
-            optimal,
-            declared,
-            efficiency,
-            final_ttft,
-            final_tps,
+            (
+                "✓ Completed"
+                if model.context_test_status is ContextTestStatus.COMPLETED
+                else "✗ Failed"
+            ),
+            f"{tmc:,}" if tmc else "N/A",
+            model.formatted_context_limit,
+            f"{(tmc / model.context_limit * 100):.1f}%" if tmc else "N/A",
+            (
+                f"{model.ttft_seconds:.2f}s"
+                if getattr(model, "ttft_seconds", None) is not None
+                else "-"
+            ),
+            f"{model.tps:.1f}" if getattr(model, "tps", None) is not None else "-",
         )
+        for model in updated_models
+        for tmc in (model.tested_max_context,)
+    ]
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
 
     logger.debug(table)
 
@@ -492,6 +491,32 @@ def _print_final_results(updated_models: list[Model]) -> None:
 class LMStrixService:
     """Service layer for LMStrix operations."""
 
+    def __init__(self) -> None:
+        # (mtime, registry) of the last load; lets multiple commands on one
+        # service instance share a parsed registry instead of re-reading and
+        # re-validating the JSON file each time.
+        self._registry_cache: tuple[float, ModelRegistry] | None = None
+
+    def _registry(self, verbose: bool = False) -> ModelRegistry:
+        """Return the model registry, reloading only when the file changed on disk."""
+        try:
+            mtime = get_default_models_file().stat().st_mtime
+        except (OSError, LMStudioInstallationNotFoundError):
+            mtime = -1.0
+        if self._registry_cache is not None and self._registry_cache[0] == mtime:
+            return self._registry_cache[1]
+        registry = load_model_registry(verbose=verbose)
+        self._registry_cache = (mtime, registry)
+        return registry
+
+    def _cache_registry(self, registry: ModelRegistry) -> None:
+        """Re-pin the cache after a save so our own writes don't force a reload."""
+        try:
+            mtime = get_default_models_file().stat().st_mtime
+        except (OSError, LMStudioInstallationNotFoundError):
+            return
+        self._registry_cache = (mtime, registry)
+
     def scan_models(
         self,
         failed: bool = False,
@@ -506,7 +531,7 @@ class LMStrixService:
             return
 
         try:
-            with console.status("Scanning for models..."):
+            with _console().status("Scanning for models..."):
                 registry = scan_and_update_registry(
                     rescan_failed=failed,
                     rescan_all=reset,
@@ -531,6 +556,7 @@ class LMStrixService:
                 logger.debug(f"Error details: {e}")
             return
 
+        self._cache_registry(registry)
         self.list_models(verbose=verbose, _registry=registry)
 
     def list_models(
@@ -582,6 +608,7 @@ class LMStrixService:
         file_prompt: str | None = None,
         key: str | None = None,
         dry_run: bool = False,
+        workers: int = 1,
     ) -> None:
         """Test the context limits for models.
 
@@ -590,7 +617,7 @@ class LMStrixService:
         LM Studio. Useful for verifying filters and keyword matching in CI.
         """
         setup_logging(verbose=verbose)
-        registry = load_model_registry(verbose=verbose)
+        registry = self._registry(verbose=verbose)
 
         if test_all and model_id:
             logger.error("Cannot use --all and specify a model ID together.")
@@ -602,7 +629,6 @@ class LMStrixService:
             ctx,
             model_id,
             reset,
-            fast,
         )
         if not models_to_test:
             return
@@ -618,11 +644,11 @@ class LMStrixService:
 
         # Dry-run: print what would be tested and exit without touching LM Studio
         if dry_run:
-            console.print(
+            _console().print(
                 f"[bold cyan]Dry run — {len(models_to_test)} model(s) would be tested:[/bold cyan]"
             )
             for m in models_to_test:
-                console.print(
+                _console().print(
                     f"  [yellow]{m.id}[/yellow]  "
                     f"ctx_in={m.context_limit:,}  "
                     f"threshold={min(threshold, m.context_limit):,}"
@@ -677,27 +703,23 @@ class LMStrixService:
                 logger.error(f"Error reading prompt file: {e}")
                 return
 
+        tester = ContextTester(
+            verbose=verbose,
+            fast_mode=fast,
+            custom_prompt=custom_prompt,
+            max_workers=workers,
+        )
+
         if test_all:
-            # Filter out embedding models for --all flag
-            tester = ContextTester(verbose=verbose, fast_mode=fast, custom_prompt=custom_prompt)
-            models_to_test = tester._filter_models_for_testing(models_to_test)
-            if not models_to_test:
-                logger.debug(
-                    "No LLM models found to test after filtering embedding models.",
-                )
-                return
+            # Embedding models were already excluded by _get_models_to_test,
+            # so no second filtering pass over the list is needed here.
             # Custom sorting for optimal testing: size_bytes + context_limit*100000
             # This prioritizes smaller models first, then lower context within similar sizes
-            models_to_test = sorted(
-                models_to_test,
-                key=lambda m: m.size + (m.context_limit * 100_000),
-            )
+            models_to_test.sort(key=lambda m: m.size + (m.context_limit * 100_000))
             logger.debug(
                 "[cyan]Sorting models by optimal testing order (size + context priority).[/cyan]",
             )
 
-        tester = ContextTester(verbose=verbose, fast_mode=fast, custom_prompt=custom_prompt)
-
         if ctx is not None:
             if test_all:
                 updated_models = _test_all_models_at_ctx(
@@ -710,6 +732,7 @@ class LMStrixService:
                 _print_final_results(updated_models)
             else:
                 _test_single_model(tester, models_to_test[0], ctx, registry, force, verbose)
+            self._cache_registry(registry)
             return
 
         if test_all:
@@ -726,7 +749,7 @@ class LMStrixService:
 
             if verbose:
                 logger.debug(f"\n[bold cyan]Testing model: {model.id}[/bold cyan]")
-                logger.debug(f"Declared context limit: {model.context_limit:,} tokens")
+                logger.debug(f"Declared context limit: {model.formatted_context_limit} tokens")
                 logger.debug(f"Threshold: {threshold:,} tokens")
             else:
                 # Compact output - create a live table for testing progress
@@ -744,7 +767,7 @@ class LMStrixService:
                     "",
                 )
 
-                live = Live(table, console=console, refresh_per_second=4)
+                live = Live(table, console=_console(), refresh_per_second=4)
                 live.start()
 
             updated_model = tester.test_model(
@@ -753,7 +776,7 @@ class LMStrixService:
                 registry=registry,
             )
 
-            if updated_model.context_test_status.value == "completed":
+            if updated_model.context_test_status is ContextTestStatus.COMPLETED:
                 response_preview = getattr(updated_model, "_test_response_preview", "❌")
                 if verbose:
                     logger.debug(
@@ -816,6 +839,8 @@ class LMStrixService:
                     live.update(table)
                     live.stop()
 
+        self._cache_registry(registry)
+
     def run_inference(
         self,
         prompt: str,
@@ -854,6 +879,7 @@ class LMStrixService:
             stream=stream,
             stream_timeout=stream_timeout,
             verbose=verbose,
+            registry=self._registry(verbose=verbose),
         )
 
     def check_health(self, verbose: bool = False) -> None:
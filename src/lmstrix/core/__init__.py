@@ -1,11 +1,25 @@
 """Core functionality for LMStrix."""
 
-from lmstrix.core.context import ContextOptimizer, OptimizationResult
-from lmstrix.core.context_tester import ContextTester, ContextTestResult
-from lmstrix.core.inference_manager import InferenceManager
-from lmstrix.core.models import ContextTestStatus, Model, ModelRegistry
-from lmstrix.core.prompts import PromptResolver, ResolvedPrompt
-from lmstrix.utils.logging import logger
+import importlib
+from typing import Any
+
+# The submodules behind these re-exports pull in heavy machinery (tiktoken
+# for context, the LM Studio SDK for the tester and inference manager), so
+# they resolve lazily via PEP 562 instead of at package import. CLI commands
+# that never test or infer skip that import cost entirely.
+_EXPORTS = {
+    "ContextOptimizer": "lmstrix.core.context",
+    "OptimizationResult": "lmstrix.core.context",
+    "ContextTestResult": "lmstrix.core.context_tester",
+    "ContextTester": "lmstrix.core.context_tester",
+    "InferenceManager": "lmstrix.core.inference_manager",
+    "ContextTestStatus": "lmstrix.core.models",
+    "Model": "lmstrix.core.models",
+    "ModelRegistry": "lmstrix.core.models",
+    "PromptResolver": "lmstrix.core.prompts",
+    "ResolvedPrompt": "lmstrix.core.prompts",
+    "logger": "lmstrix.utils.logging",
+}
 
 __all__ = [
     "ContextOptimizer",
@@ -19,3 +33,13 @@ __all__ = [
     "PromptResolver",
     "ResolvedPrompt",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache so subsequent lookups bypass __getattr__.
+    globals()[name] = value
+    return value
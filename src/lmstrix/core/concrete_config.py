@@ -3,6 +3,8 @@
 # this_file: src/lmstrix/core/concrete_config.py
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -171,29 +173,40 @@ class ConcreteConfigManager:
         limit_value: int = 100,
         is_percentage: bool = True,
         threshold: int = 0,
+        *,
+        max_workers: int | None = None,
     ) -> tuple[int, int]:
         """Save concrete configs for all models with tested contexts.
 
+        Each config write touches a different file, so the I/O-bound
+        read/update/write cycles run on a thread pool instead of one model
+        at a time.
+
         Args:
             models: List of models to process
             enable_flash: Whether to enable flash attention for GGUF models
             limit_value: Either percentage (if is_percentage=True) or absolute limit
             is_percentage: True if limit_value is a percentage, False if absolute
             threshold: Only used with percentage - apply percentage if context > threshold
+            max_workers: Thread pool size; defaults to min(8, cpu count).
 
         Returns:
             Tuple of (successful_saves, failed_saves)
         """
-        successful = 0
-        failed = 0
-
-        for model in models:
-            if model.tested_max_context:
-                if self.save_model_config(
-                    model, enable_flash, limit_value, is_percentage, threshold
-                ):
-                    successful += 1
-                else:
-                    failed += 1
-
-        return successful, failed
+        to_save = [m for m in models if m.tested_max_context]
+        if not to_save:
+            return 0, 0
+
+        if max_workers is None:
+            max_workers = min(8, os.cpu_count() or 4)
+
+        def save_one(model: Model) -> bool:
+            return self.save_model_config(
+                model, enable_flash, limit_value, is_percentage, threshold
+            )
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(to_save))) as ex:
+            results = list(ex.map(save_one, to_save))
+
+        successful = sum(results)
+        return successful, len(results) - successful
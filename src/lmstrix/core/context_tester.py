@@ -1,5 +1,9 @@
 """The binary search runner that pushes models until they break to find their true context limits."""
 
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import TYPE_CHECKING, ClassVar
 
@@ -11,6 +15,38 @@ if TYPE_CHECKING:
 
 from lmstrix.core.models import ContextTestStatus
 
+# Minimum seconds between full registry rewrites during batch testing. Each
+# save serializes the whole JSON file, so per-model flushing is O(N²) bytes
+# over a sweep; results are debounced to this interval and always flushed
+# once more when the batch ends.
+REGISTRY_FLUSH_INTERVAL_SECONDS = 2.0
+
+
+@functools.cache
+def _is_embedding_id(model_id: str) -> bool:
+    """Heuristic: embedding models carry 'embed'/'embedding' in their id."""
+    lowered = model_id.lower()
+    return "embedding" in lowered or "embed" in lowered
+
+
+def is_embedding_model(model) -> bool:
+    """Check whether a model is an embedding model (cannot be context-tested).
+
+    Free function so filter passes (e.g. api.main._get_models_to_test) can
+    run the predicate without constructing a ContextTester; verdicts are
+    memoized per model id for the life of the process.
+
+    Args:
+        model: Model object to check.
+
+    Returns:
+        True if the model is an embedding model, False otherwise.
+    """
+    model_id = getattr(model, "id", None)
+    if not model_id:
+        return False
+    return _is_embedding_id(model_id)
+
 
 class ContextTestResult:
     """A record of what happened when we tried to load and run a model at a specific context size."""
@@ -95,6 +131,7 @@ class ContextTester:
         verbose: bool = False,
         fast_mode: bool = False,
         custom_prompt: str | None = None,
+        max_workers: int = 1,
     ) -> None:
         """Initialize context tester.
 
@@ -103,6 +140,9 @@ class ContextTester:
             verbose: Enable verbose logging output.
             fast_mode: Skip semantic verification - only test if inference completes.
             custom_prompt: Custom prompt to use for testing instead of built-in prompts.
+            max_workers: Models probed concurrently in test_all_models. Keep 1
+                for a single GPU slot; raise for CPU-only or multi-endpoint
+                setups where independent models can genuinely overlap.
         """
         self.client = client or LMStudioClient()
         self.inference_engine = InferenceEngine(
@@ -131,6 +171,7 @@ class ContextTester:
         self.verbose = verbose
         self.fast_mode = fast_mode
         self.custom_prompt = custom_prompt
+        self.max_workers = max(1, max_workers)
         self.inference_timeout = 90.0  # Increased to 90 seconds for better reliability
         self.max_retries = 2  # Retry timeouts up to 2 times
 
@@ -192,17 +233,16 @@ class ContextTester:
     def _is_embedding_model(self, model) -> bool:
         """Check if a model is an embedding model.
 
+        Thin wrapper over the module-level is_embedding_model predicate,
+        kept for callers holding a tester instance.
+
         Args:
             model: Model object to check
 
         Returns:
             True if the model is an embedding model, False otherwise
         """
-        # Check if model has the id attribute and contains embedding keywords
-        if hasattr(model, "id") and model.id:
-            model_id = model.id.lower()
-            return "embedding" in model_id or "embed" in model_id
-        return False
+        return is_embedding_model(model)
 
     def _filter_models_for_testing(self, models: list) -> list:
         """Filter out embedding models from the list of models to test.
@@ -235,9 +275,22 @@ class ContextTester:
         Returns:
             List of updated models with test results
         """
-        updated_models = []
-
-        for model in models_to_test:
+        registry_lock = threading.Lock()
+        last_flush = time.monotonic()
+
+        def record_result(model: "Model") -> None:
+            """Store a result, rewriting the registry file at most every
+            REGISTRY_FLUSH_INTERVAL_SECONDS; the finally block below flushes
+            whatever is still pending."""
+            nonlocal last_flush
+            with registry_lock:
+                now = time.monotonic()
+                flush = now - last_flush >= REGISTRY_FLUSH_INTERVAL_SECONDS
+                registry.update_model_by_id(model, flush=flush)
+                if flush:
+                    last_flush = now
+
+        def test_one(model: "Model") -> "Model":
             # Test the model at the threshold context size
             result = self._test_at_context(
                 model.id,
@@ -262,9 +315,25 @@ class ContextTester:
 
             # Update registry if provided
             if registry:
-                registry.update_model_by_id(model)
+                record_result(model)
 
-            updated_models.append(model)
+            return model
+
+        # max_workers defaults to 1 (sequential, one GPU slot); higher values
+        # let independent models overlap on multi-endpoint/CPU-only setups.
+        updated_models = []
+        try:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(models_to_test) or 1),
+            ) as ex:
+                futures = [ex.submit(test_one, model) for model in models_to_test]
+                for future in as_completed(futures):
+                    updated_models.append(future.result())
+        finally:
+            # Persist results that arrived since the last debounced flush,
+            # including partial progress if the sweep was interrupted.
+            if registry:
+                registry.save()
 
         return updated_models
 
@@ -12,11 +12,10 @@ from loguru import logger
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from lmstrix.core.inference_manager import InferenceManager
-
 DROID_TIMEOUT_SECS = 120
 
 if TYPE_CHECKING:
+    from lmstrix.core.inference_manager import InferenceManager
     from lmstrix.core.models import Model, ModelRegistry
 
 # Valid keyword vocabulary, grouped by category
@@ -305,6 +304,10 @@ def describe_models(
 
     inference_mgr = None
     if not use_droid:
+        # Imported here so keyword filtering/sorting callers of this module
+        # (list, test) never pull in the LM Studio SDK.
+        from lmstrix.core.inference_manager import InferenceManager
+
         inference_mgr = InferenceManager(verbose=verbose)
 
     all_models = registry.list_models()
@@ -2,13 +2,16 @@
 
 # this_file: src/lmstrix/core/models_simple.py
 
+import functools
 import json
 import re
+from collections.abc import Iterator
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from lmstrix.utils.json_io import json_loads
 from lmstrix.utils.logging import logger
 from lmstrix.utils.paths import get_default_models_file
 
@@ -130,6 +133,15 @@ class Model:
             ]
         }
 
+    @functools.cached_property
+    def formatted_context_limit(self) -> str:
+        """Thousands-separated context_limit for table/log rendering.
+
+        Cached: the declared limit never changes after construction, while
+        listing and test tables format it once per row per render.
+        """
+        return f"{self.context_limit:,}"
+
     @staticmethod
     def _normalize_capabilities(
         capabilities: dict[str, Any] | None,
@@ -254,25 +266,36 @@ class ModelRegistryError(Exception):
 class ModelRegistry:
     """Simplified model registry without complex validation."""
 
-    def __init__(self, models_file: Path | None = None) -> None:
-        """Initialize the model registry."""
+    def __init__(self, models_file: Path | None = None, preparsed: dict | None = None) -> None:
+        """Initialize the model registry.
+
+        Args:
+            models_file: Path to the registry JSON. Defaults to the standard
+                location.
+            preparsed: Already-parsed registry data; skips re-reading and
+                re-parsing the file (used by doctor, which parses the file
+                once for its validity check).
+        """
         self.models_file = models_file or self._get_default_models_file()
         self._models: dict[str, Model] = {}
+        # Secondary index: model.id -> registry key. Keys are usually paths,
+        # so id lookups would otherwise scan the whole registry.
+        self._by_id: dict[str, str] = {}
         self.lms_path: Path | None = None  # Compatibility
-        self.load()
+        self.load(preparsed)
 
     def _get_default_models_file(self) -> Path:
         """Get the default models file path."""
         return get_default_models_file()
 
-    def load(self) -> None:
-        """Load models from JSON file."""
-        if not self.models_file.exists():
+    def load(self, preparsed: dict | None = None) -> None:
+        """Load models from JSON file (or from an already-parsed dict)."""
+        if preparsed is None and not self.models_file.exists():
             logger.warning(f"Models file {self.models_file} not found")
             return
 
         try:
-            data = json.loads(self.models_file.read_text())
+            data = preparsed if preparsed is not None else json_loads(self.models_file.read_bytes())
 
             # Get LMS path from data if available
             if "path" in data:
@@ -289,15 +312,34 @@ class ModelRegistry:
                         model_info["model_id"] = model_id
                     model = Model(**model_info)
                     self._models[model_id] = model
+                    self._by_id[model.id] = model_id
                 except Exception as e:
                     logger.warning(f"Failed to load model {model_id}: {e}")
                     continue
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # Covers both json.JSONDecodeError and orjson.JSONDecodeError.
             logger.error(f"Failed to parse models file: {e}")
         except Exception as e:
             logger.error(f"Failed to load models: {e}")
 
+    @classmethod
+    def read_model_ids(cls, json_path: Path | None = None) -> list[str]:
+        """Read just the model ids from the registry file, sorted ascending.
+
+        Fast path for ``lmstrix list --show id/path``: parses the raw JSON
+        without constructing Model objects, so an id dump skips one
+        validation pass per registry entry.
+        """
+        registry_path = json_path or get_default_models_file()
+        try:
+            data = json_loads(registry_path.read_bytes())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read model ids from {registry_path}: {e}")
+            return []
+        llms = data.get("llms", {})
+        return sorted(info.get("id", key) for key, info in llms.items())
+
     def save(self) -> None:
         """Save models to JSON file."""
         try:
@@ -324,14 +366,24 @@ class ModelRegistry:
     def add_model(self, model: Model) -> None:
         """Add a model to the registry."""
         self._models[model.id] = model
+        self._by_id[model.id] = model.id
         self.save()  # Auto-save for compatibility
 
-    def update_model(self, model_id: str, model: Model) -> None:
-        """Update a model in the registry (adds if not exists for compatibility)."""
+    def update_model(self, model_id: str, model: Model, flush: bool = True) -> None:
+        """Update a model in the registry (adds if not exists for compatibility).
+
+        Args:
+            model_id: Registry key to store the model under.
+            model: The model to store.
+            flush: Write the registry to disk immediately. Batch callers pass
+                False and call save() once at the end to avoid O(N) rewrites.
+        """
         self._models[model_id] = model
-        self.save()  # Auto-save for compatibility
+        self._by_id[model.id] = model_id
+        if flush:
+            self.save()  # Auto-save for compatibility
 
-    def update_model_by_id(self, model: Model) -> None:
+    def update_model_by_id(self, model: Model, flush: bool = True) -> None:
         """Update a model using its own ID, finding existing entry by path or ID."""
         # First, try to find the existing model by checking all keys
         existing_key = None
@@ -342,6 +394,9 @@ class ModelRegistry:
         # Otherwise, check if there's an entry with the model ID
         elif model.id in self._models:
             existing_key = model.id
+        # Consult the id index before resorting to a scan
+        elif model.id in self._by_id:
+            existing_key = self._by_id[model.id]
         else:
             # Search through all models to find one with matching path or ID
             for key, existing_model in self._models.items():
@@ -351,7 +406,7 @@ class ModelRegistry:
 
         # Update using the existing key if found, otherwise use model.id
         key_to_use = existing_key if existing_key else model.id
-        self.update_model(key_to_use, model)
+        self.update_model(key_to_use, model, flush=flush)
 
     def get_model(self, model_id: str) -> Model | None:
         """Get a model by ID."""
@@ -367,10 +422,10 @@ class ModelRegistry:
         if model_identifier in self._models:
             return self._models[model_identifier]
 
-        # Search by model ID across all models
-        for model in self._models.values():
-            if model.id == model_identifier:
-                return model
+        # O(1) id lookup via the secondary index
+        key = self._by_id.get(model_identifier)
+        if key is not None:
+            return self._models.get(key)
 
         return None
 
@@ -378,10 +433,37 @@ class ModelRegistry:
         """List all models in the registry."""
         return list(self._models.values())
 
+    def iter_models(self) -> Iterator[Model]:
+        """Iterate over models without materializing a list.
+
+        For single-pass consumers (filters, sums, sorted()) this skips the
+        intermediate copy that list_models() makes.
+        """
+        return iter(self._models.values())
+
+    def validate_all(self) -> list[str]:
+        """Return the registry keys of models that fail integrity checks.
+
+        Batched counterpart to Model.validate_integrity: one pass over the
+        registry with inline comparisons, skipping the per-field warning
+        logging that makes the per-model method slow to call in a loop.
+        Used by the doctor command (api/health.py).
+        """
+        return [
+            model_path
+            for model_path, model in self._models.items()
+            if model.size <= 0
+            or model.context_limit <= 0
+            or model.context_out <= 0
+            or model.context_out > model.context_limit
+        ]
+
     def remove_model(self, model_id: str) -> bool:
         """Remove a model from the registry."""
         if model_id in self._models:
-            del self._models[model_id]
+            removed = self._models.pop(model_id)
+            if self._by_id.get(removed.id) == model_id:
+                del self._by_id[removed.id]
             self.save()  # Auto-save for compatibility
             return True
         return False
@@ -389,6 +471,7 @@ class ModelRegistry:
     def clear(self) -> None:
         """Clear all models from the registry."""
         self._models.clear()
+        self._by_id.clear()
 
     def __len__(self) -> int:
         """Return the number of models."""
@@ -1,15 +1,23 @@
 """Data loaders for LMStrix."""
 
-from lmstrix.loaders.context_loader import (
-    estimate_tokens,
-    load_context,
-    load_context_with_limit,
-    load_multiple_contexts,
-    save_context,
-)
-from lmstrix.loaders.model_loader import load_model_registry, save_model_registry
-from lmstrix.loaders.prompt_loader import load_prompts, load_single_prompt, save_prompts
-from lmstrix.utils.logging import logger
+import importlib
+from typing import Any
+
+# context_loader imports tiktoken at module scope, so these re-exports
+# resolve lazily (PEP 562); importing model_loader alone stays cheap.
+_EXPORTS = {
+    "estimate_tokens": "lmstrix.loaders.context_loader",
+    "load_context": "lmstrix.loaders.context_loader",
+    "load_context_with_limit": "lmstrix.loaders.context_loader",
+    "load_multiple_contexts": "lmstrix.loaders.context_loader",
+    "save_context": "lmstrix.loaders.context_loader",
+    "load_model_registry": "lmstrix.loaders.model_loader",
+    "save_model_registry": "lmstrix.loaders.model_loader",
+    "load_prompts": "lmstrix.loaders.prompt_loader",
+    "load_single_prompt": "lmstrix.loaders.prompt_loader",
+    "save_prompts": "lmstrix.loaders.prompt_loader",
+    "logger": "lmstrix.utils.logging",
+}
 
 __all__ = [
     "estimate_tokens",
@@ -26,3 +34,13 @@ __all__ = [
     "save_model_registry",
     "save_prompts",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache so subsequent lookups bypass __getattr__.
+    globals()[name] = value
+    return value
@@ -13,16 +13,25 @@ from lmstrix.core.models import (
 from lmstrix.utils.logging import logger
 from lmstrix.utils.paths import get_default_models_file
 
+# Per-process registry cache keyed by file path. Entries are invalidated by
+# the file's (st_mtime_ns, st_size) signature, so a save from this process or
+# an external edit triggers a fresh parse on the next load, while repeated
+# loads within one interpreter (fire dispatch, tests) skip the read+parse.
+_registry_cache: dict[Path, tuple[tuple[int, int], ModelRegistry]] = {}
+
 
 def load_model_registry(
     json_path: Path | None = None,
     verbose: bool = False,
+    preparsed: dict | None = None,
 ) -> ModelRegistry:
     """Load the model registry from a JSON file.
 
     Args:
         json_path: Path to the JSON file. If None, uses the default location.
         verbose: Enable verbose logging.
+        preparsed: Already-parsed registry data; avoids a second parse when
+            the caller has just read the file (e.g. doctor's validity check).
 
     Returns:
         A ModelRegistry instance.
@@ -34,11 +43,28 @@ def load_model_registry(
 
     registry_path = json_path or get_default_models_file()
 
-    if not registry_path.exists():
+    if preparsed is not None:
+        # Caller already holds the current file contents; build straight from
+        # them without consulting (or polluting) the cache.
+        registry = ModelRegistry(models_file=registry_path, preparsed=preparsed)
+        logger.info(f"Read {len(registry)} models from {registry_path}")
+        return registry
+
+    # One stat covers both the existence check and the cache signature.
+    try:
+        stat = registry_path.stat()
+    except FileNotFoundError:
         logger.warning(f"Model registry not found at {registry_path}. Returning empty registry.")
         return ModelRegistry(models_file=registry_path)
 
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _registry_cache.get(registry_path)
+    if cached is not None and cached[0] == signature:
+        logger.info(f"Reusing cached registry for {registry_path}")
+        return cached[1]
+
     registry = ModelRegistry(models_file=registry_path)
+    _registry_cache[registry_path] = (signature, registry)
     logger.info(f"Read {len(registry)} models from {registry_path}")
     return registry
 
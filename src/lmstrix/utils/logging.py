@@ -10,13 +10,27 @@ from loguru import logger
 # Export logger so it can be imported from this module
 __all__ = ["logger", "setup_logging"]
 
+# Verbosity the handlers are currently configured for. Commands call
+# setup_logging() liberally (often several times per CLI invocation), so this
+# guard makes repeat calls with the same flag a no-op instead of tearing down
+# and rebuilding the handler chain every time. A one-element list so
+# setup_logging can update it without a `global` statement.
+_configured_verbose: list[bool | None] = [None]
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Configure loguru logging based on verbose flag.
 
+    Idempotent: repeated calls with the same verbosity return immediately;
+    only a change in verbosity reconfigures the handlers.
+
     Args:
         verbose: Enable verbose output with DEBUG level logging.
     """
+    if _configured_verbose[0] == verbose:
+        return
+    _configured_verbose[0] = verbose
+
     # Remove default logger
     logger.remove()
 
@@ -1,5 +1,6 @@
 """File system utilities. Handles finding LM Studio, the model registry, and log files."""
 
+import functools
 from pathlib import Path
 
 from lmstrix.api.exceptions import LMStudioInstallationNotFoundError
@@ -91,9 +92,13 @@ def get_context_tests_dir() -> Path:
     return tests_dir
 
 
+@functools.lru_cache(maxsize=1024)
 def get_context_test_log_path(model_id: str) -> Path:
     """Get the path for a specific model's context test log.
 
+    Pure function of model_id, and called once per model per test pass, so
+    the sanitized path is cached to skip redundant string/filesystem work.
+
     Args:
         model_id: The model identifier.
 
@@ -1,5 +1,9 @@
 """Tests for LMStudioClient."""
 
+import asyncio
+import json
+import threading
+import time
 from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
@@ -51,15 +55,15 @@ class TestLMStudioClient:
             LMStudioClient(verbose=False)
             mock_logger.disable.assert_called_with("lmstrix")
 
-    @patch("lmstrix.api.client.httpx.get")
+    @patch("lmstrix.api.client.httpx.Client")
     @patch("lmstrix.api.client.lmstudio")
     def test_list_models_success(
         self: "TestLMStudioClient",
         mock_lmstudio: Mock,
-        mock_http_get: Mock,
+        mock_http_client: Mock,
     ) -> None:
         """Test successful list_models call."""
-        mock_http_get.side_effect = Exception("REST API unavailable")
+        mock_http_client.return_value.get.side_effect = Exception("REST API unavailable")
         mock_model_info1 = Mock(
             model_key="model1",
             path="/path/to/model1",
@@ -124,12 +128,12 @@ class TestLMStudioClient:
         assert result == expected_result
         mock_lmstudio.list_downloaded_models.assert_called_once()
 
-    @patch("lmstrix.api.client.httpx.get")
+    @patch("lmstrix.api.client.httpx.Client")
     @patch("lmstrix.api.client.lmstudio")
     def test_list_models_merges_rest_capabilities(
         self: "TestLMStudioClient",
         mock_lmstudio: Mock,
-        mock_http_get: Mock,
+        mock_http_client: Mock,
     ) -> None:
         """Test REST model capabilities override SDK fallback metadata."""
         mock_model_info = SimpleNamespace(
@@ -147,23 +151,25 @@ class TestLMStudioClient:
 
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
-            "models": [
-                {
-                    "key": "google/gemma-4-26b-a4b",
-                    "type": "llm",
-                    "capabilities": {
-                        "vision": True,
-                        "trained_for_tool_use": True,
-                        "reasoning": {
-                            "allowed_options": ["off", "on"],
-                            "default": "on",
+        mock_response.content = json.dumps(
+            {
+                "models": [
+                    {
+                        "key": "google/gemma-4-26b-a4b",
+                        "type": "llm",
+                        "capabilities": {
+                            "vision": True,
+                            "trained_for_tool_use": True,
+                            "reasoning": {
+                                "allowed_options": ["off", "on"],
+                                "default": "on",
+                            },
                         },
                     },
-                },
-            ],
-        }
-        mock_http_get.return_value = mock_response
+                ],
+            }
+        ).encode()
+        mock_http_client.return_value.get.return_value = mock_response
 
         result = LMStudioClient().list_models()
 
@@ -178,15 +184,15 @@ class TestLMStudioClient:
             },
         }
 
-    @patch("lmstrix.api.client.httpx.get")
+    @patch("lmstrix.api.client.httpx.Client")
     @patch("lmstrix.api.client.lmstudio")
     def test_list_models_uses_sdk_capability_fallback(
         self: "TestLMStudioClient",
         mock_lmstudio: Mock,
-        mock_http_get: Mock,
+        mock_http_client: Mock,
     ) -> None:
         """Test SDK snake_case capability fields are used when REST is unavailable."""
-        mock_http_get.side_effect = Exception("server unavailable")
+        mock_http_client.return_value.get.side_effect = Exception("server unavailable")
         mock_model_info = SimpleNamespace(
             model_key="tool-model",
             path="/path/to/tool-model",
@@ -301,6 +307,9 @@ class TestLMStudioClient:
                 "minPSampling": 0.05,
             },
         )
+        # The SDK asserts isinstance(config, dict), and MappingProxyType
+        # compares equal to dict above, so pin the concrete type too.
+        assert type(mock_llm.complete.call_args.kwargs["config"]) is dict
 
     def test_completion_failure(
         self: "TestLMStudioClient",
@@ -342,3 +351,92 @@ class TestLMStudioClient:
                 "minPSampling": 0.05,
             },
         )
+
+    def test_acompletion_respects_max_concurrency(
+        self: "TestLMStudioClient",
+        mock_llm: Mock,
+    ) -> None:
+        """Test acompletion never overlaps more completions than max_concurrency."""
+        client = LMStudioClient(max_concurrency=2)
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def slow_completion(llm: Mock, prompt: str, **kwargs: object) -> CompletionResponse:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return CompletionResponse(content=prompt, model="test-model")
+
+        with patch.object(client, "completion", side_effect=slow_completion):
+            results = asyncio.run(
+                client.batch_acompletion(mock_llm, [f"p{i}" for i in range(6)]),
+            )
+
+        assert [r.content for r in results] == [f"p{i}" for i in range(6)]
+        assert peak <= 2
+
+    def test_acompletion_reusable_across_event_loops(
+        self: "TestLMStudioClient",
+        mock_llm: Mock,
+    ) -> None:
+        """Test the concurrency semaphore is recreated for each new event loop.
+
+        Each asyncio.run() call spins up a fresh loop; a semaphore bound to
+        the first loop would make the second call raise "bound to a different
+        event loop".
+        """
+        client = LMStudioClient(max_concurrency=2)
+        response = CompletionResponse(content="ok", model="test-model")
+
+        with patch.object(client, "completion", return_value=response):
+            first = asyncio.run(client.acompletion(mock_llm, "one"))
+            second = asyncio.run(client.acompletion(mock_llm, "two"))
+
+        assert first.content == "ok"
+        assert second.content == "ok"
+
+    @patch("lmstrix.api.client.httpx.Client")
+    def test_batch_completion_single_request_demux_order(
+        self: "TestLMStudioClient",
+        mock_http_client: Mock,
+    ) -> None:
+        """Test batch choices are demultiplexed back into prompt order."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps(
+            {
+                "choices": [
+                    {"index": 2, "text": "third"},
+                    {"index": 0, "text": "first"},
+                    {"index": 1, "text": "second"},
+                ],
+            }
+        ).encode()
+        mock_http_client.return_value.post.return_value = mock_response
+
+        client = LMStudioClient()
+        results = client.batch_completion_single_request("test-model", ["a", "b", "c"])
+
+        assert results == ["first", "second", "third"]
+
+    @patch("lmstrix.api.client.httpx.Client")
+    def test_batch_completion_single_request_malformed_response(
+        self: "TestLMStudioClient",
+        mock_http_client: Mock,
+    ) -> None:
+        """Test an out-of-range choice index raises InferenceError."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps({"choices": [{"index": 5, "text": "x"}]}).encode()
+        mock_http_client.return_value.post.return_value = mock_response
+
+        client = LMStudioClient()
+        with pytest.raises(InferenceError) as exc_info:
+            client.batch_completion_single_request("test-model", ["a", "b"])
+
+        assert "Malformed batch completion response" in str(exc_info.value)